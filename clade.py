@@ -83,6 +83,7 @@ class Clade:
         '_beneficial_scale', \
         '_deleterious_shape', \
         '_deleterious_scale', \
+        '_fast_params', \
     )
 
     # class-level list of Clade objects 
@@ -109,8 +110,35 @@ class Clade:
             clade: a Clade object
         '''
         assert(isinstance(clade, Clade))
+        # the clade's values are all set by now (see parser.py), so also
+        # build its tuple of constants used on every symbiont event
+        clade._fast_params = clade._computeFastParams()
         cls.clade_objects.append(clade)
 
+    ################################################
+    @classmethod
+    def fast(cls, clade_number: int) -> tuple:
+        ''' class-level method to return the tuple of per-clade constants
+            used on every symbiont event, so that symbionts need not call a
+            getter for each value; the tuple contains, in order:
+                [0] mitotic cost rate       [1] mitotic cost rate fuzz
+                [2] G0 length               [3] G0 fuzz
+                [4] G1SG2M length           [5] G1SG2M fuzz
+                [6] max initial surplus     [7] initial surplus shape
+                [8] initial surplus scale   [9] G0 escape prob
+                [10] G1SG2M escape prob     [11] parent eviction prob
+                [12] PPR                    [13] PPR fuzz
+                [14] PPR row reduction, i.e., (1-k)/k for photosynthetic
+                     reduction k (see Symbiont._computeProductionRate)
+                [15] arrival affinity prob  [16] division affinity prob
+        Parameters:
+            clade_number: integer valued number of clade
+        Returns:
+            a tuple of numbers, as above (only [0], [1] and [14] are converted
+            to float; the others are as stored by the setters)
+        '''
+        return cls.clade_objects[clade_number]._fast_params
+
     ##############################################
     def __init__(self, clade_number: int) -> None:
         ''' initializer for a Clade object
@@ -161,6 +189,26 @@ class Clade:
         self._deleterious_shape       : float = None   # shape for deleterious gamma
         self._deleterious_scale       : float = None   # scale for deleterious gamma
 
+        # tuple of the constants above used on every symbiont event, set once
+        # the clade is complete -- see addClade() and fast()
+        self._fast_params             : tuple = None
+
+    ############################################################################
+    def _computeFastParams(self) -> tuple:
+        ''' builds the tuple of per-clade constants returned by Clade.fast()
+        Returns:
+            a tuple of numbers (see fast() for the order and types)
+        '''
+        return (float(self._mitotic_cost_rate),  float(self._mcr_fuzz), \
+                self._g0_length,                 self._g0_fuzz, \
+                self._g1sg2m_length,             self._g1sg2m_fuzz, \
+                self._max_initial_surplus,       self._initial_surplus_shape, \
+                self._initial_surplus_scale,     self._g0_escape_prob, \
+                self._g1sg2m_escape_prob,        self._parent_eviction_prob, \
+                self._photosynthetic_production_rate, self._ppr_fuzz, \
+                float(1 - self._photosynthetic_reduction) / self._photosynthetic_reduction, \
+                self._arrival_affinity_prob,     self._division_affinity_prob)
+
     ############################################################################
     ''' simple setter/mutator methods '''
     def setCladeNumber(self, value: int)                    -> None: self._clade_number                   = value
@@ -1,11 +1,18 @@
-from enum import Enum
-from heapq import heappush, heappop
+from enum import IntEnum
+from heapq import heappush, heappop, heappushpop, heapify
+from itertools import count as _count
+
+# module-level counter for numbering events (a single C-level call per event,
+# rather than a load and store of a class-level variable)
+_next_event_num = _count().__next__
 
 ################################################################################
-class EventType(Enum):
+class EventType(IntEnum):
     # The event types are in a particular order below for ordering events;
     # so, for example, if two events have the same time, an escape event
     # takes precedence over a digestion event, etc.
+    # (an IntEnum, so that the plain int stored in an Event compares equal
+    # to the corresponding member, e.g., event.getType() == EventType.ESCAPE)
     EVENT_MIN_SENTINEL  = -1
     ESCAPE              =  0
     DIGESTION           =  1
@@ -24,8 +31,10 @@ class Event:
     '''
     __slots__ = ('_time', '_type', '_symbiont', '_event_num')
 
-    # class-level variable to track the number of total eventds
-    _event_cnt : int = 0
+    # class-level free list of processed Event objects available for reuse,
+    # so that the simulation need not allocate (and free) a new Event object
+    # for every event -- see acquire() and release()
+    _pool : list['Event'] = []
 
     #####################################
     def __init__(self, time: float, event_type: EventType, symbiont: 'Symbiont') -> None:
@@ -35,12 +44,50 @@ class Event:
             event_type: the type of event (see EventType class)
             symbiont: the symbiont driving the event
         '''
+        self._set(time, event_type, symbiont)
+
+    #####################################
+    def _set(self, time: float, event_type: EventType, symbiont: 'Symbiont') -> None:
+        ''' (re)assigns all of the instance variables of this event, giving
+            it a new event number
+        Parameters:
+            time: time the event is to occur
+            event_type: the type of event (see EventType class)
+            symbiont: the symbiont driving the event
+        '''
         self._time     : float      = time
-        self._type     : EventType  = event_type
+        self._type     : int        = event_type.value  # plain int, not the enum member
         self._symbiont : 'Symbiont' = symbiont
-        self._event_num: int        = Event._event_cnt
+        self._event_num: int        = _next_event_num()
 
-        Event._event_cnt += 1
+    #####################################
+    @classmethod
+    def acquire(cls, time: float, event_type: EventType, symbiont: 'Symbiont') -> 'Event':
+        ''' class-level method to create an event, reusing a previously
+            released Event object if one is available
+        Parameters:
+            time: time the event is to occur
+            event_type: the type of event (see EventType class)
+            symbiont: the symbiont driving the event
+        Returns:
+            an Event object
+        '''
+        if cls._pool:
+            event = cls._pool.pop()
+            event._set(time, event_type, symbiont)
+            return event
+        return cls(time, event_type, symbiont)
+
+    #####################################
+    @classmethod
+    def release(cls, event: 'Event') -> None:
+        ''' class-level method to return an event that has been processed
+            (and so is no longer in the event list) for later reuse
+        Parameters:
+            event: an Event object no longer referenced by the simulation
+        '''
+        event._symbiont = None   # do not keep the symbiont alive via the pool
+        cls._pool.append(event)
 
     #####################################
     def __lt__(self, other: 'Event') -> bool:
@@ -50,20 +97,26 @@ class Event:
         Returns:
             True if this event should appear before the other event, False o/w
         '''
-        # sort first on event time, then on event type, then on event number (JIC)
-        return (self._time,self._type,self._event_num) \
-            < (other._time,other._type,other._event_num)
+        # sort first on event time, then on event type, then on event number (JIC);
+        # compare field-by-field (rather than building tuples) since this is
+        # called on every heap sift, and use the int value of the event type
+        # (stored as a plain int) so that no Enum comparison is needed
+        if self._time != other._time:
+            return self._time < other._time
+        if self._type != other._type:
+            return self._type < other._type
+        return self._event_num < other._event_num
 
     #####################################
     ''' simple getter/accessor methods '''
-    def getType(self)     -> EventType:  return self._type
+    def getType(self)     -> int:        return self._type  # compare against EventType
     def getTime(self)     -> float:      return self._time 
     def getSymbiont(self) -> 'Symbiont': return self._symbiont
 
     ###########################
     def __str__(self) -> str:
         ''' returns an str representation of this Event object '''
-        return f"{self._type.name} @ t= {self._time} :\n\t{self._symbiont}"
+        return f"{EventType(self._type).name} @ t= {self._time} :\n\t{self._symbiont}"
 
 ###############################################################################
 class EventList:
@@ -71,7 +124,9 @@ class EventList:
         Python list initially, but converted to a priority queue using
         heapq.heappush and heapq.heappop.  This facilitates efficient insertion
         and removal of time-sequenced events as part of the event calendar 
-        (event list).
+        (event list).  Each heap entry is a (time, event type value, event
+        number, event) tuple, so that heapq orders entries using C-level
+        comparison of primitives without ever calling Event.__lt__.
     '''
     __slots__ = ('_heap')
 
@@ -86,9 +141,25 @@ class EventList:
         Returns:
             an Event object corresponding to the next event to occur
         '''
-        event = None
-        if len(self._heap) > 0: event = heappop(self._heap)
-        return event   # empty list returns None
+        # rely on heappop raising IndexError for an empty heap rather than
+        # checking the length before every pop
+        try:
+            return heappop(self._heap)[-1]
+        except IndexError:
+            return None   # empty list returns None
+
+    #############################################################
+    def insertAndGetNextEvent(self, event: 'Event') -> 'Event':
+        ''' inserts a new event and then returns the next event to occur,
+            equivalent to insertEvent(event) followed by getNextEvent(), but
+            using a single heap sift (heapq.heappushpop)
+        Parameters:
+            event: an Event object (w/ info time, event type, associated symbiont)
+        Returns:
+            an Event object corresponding to the next event to occur
+        '''
+        assert(event != None)
+        return heappushpop(self._heap, (event._time, event._type, event._event_num, event))[-1]
 
     ##############################################
     def insertEvent(self, event: 'Event') -> None:
@@ -97,7 +168,19 @@ class EventList:
             event: an Event object (w/ info time, event type, associated symbiont)
         '''
         assert(event != None)
-        heappush(self._heap, event)
+        # the event number is unique, so the event itself is never compared
+        heappush(self._heap, (event._time, event._type, event._event_num, event))
+
+    ####################################################
+    def bulkInsert(self, events: list['Event']) -> None:
+        ''' inserts a collection of new events into the event list at once,
+            restoring the heap property with a single O(n) heapify rather
+            than one heappush per event
+        Parameters:
+            events: a list of Event objects
+        '''
+        self._heap.extend((event._time, event._type, event._event_num, event) for event in events)
+        heapify(self._heap)
 
     #########################
     def __len__(self) -> int:
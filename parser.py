@@ -34,11 +34,12 @@ class Parser:
         # CSV input file, we can find the entry (key will match variable name in
         # the CSV input file) and then call the method (key's value in dict)
         # passing the parameter value given in the CSV input file
-        # (ignore the clade_object class-level variable, anything starting with
-        #  '__' (e.g., __str__), and any callable function/method)
+        # (ignore the clade_object class-level variable, the derived
+        #  _fast_params tuple, anything starting with '__' (e.g., __str__),
+        #  and any callable function/method)
         clade_methods_dict = { \
             attr.upper()[1:]:eval(morph(attr)) for attr in dir(Clade) \
-               if attr != "clade_objects" and not attr.startswith("__") and \
+               if attr not in ("clade_objects", "_fast_params") and not attr.startswith("__") and \
                   not callable(getattr(Clade, attr))}
 
         # read the input CSV as a pandas dataframe 
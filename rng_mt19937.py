@@ -1,5 +1,5 @@
 import numpy.typing
-from enum import Enum
+from enum import Enum, IntEnum
 from numpy.random import MT19937, Generator
 from parameters import *
 
@@ -32,8 +32,10 @@ class Stream(Enum):
     MITOTIC_COST_RATE_MUTATION = 21
     DIVISION_AFFINITY          = 22
 
-class MutationType(Enum):
-    ''' enumeration to identify mutation type '''
+class MutationType(IntEnum):
+    ''' enumeration to identify mutation type (an IntEnum; see divfuzz for
+        the +1/-1/0 sign used in place of these on the division path)
+    '''
     DELETERIOUS = 0
     BENEFICIAL  = 1
     NO_MUTATION = 2
@@ -53,6 +55,16 @@ class RNG:
     _streams: list[numpy.random.Generator] = []  # not yet initialized
     _initialized: bool = False
 
+    # per-stream buffers of standard normal and of [0,1) uniform variates,
+    # drawn in batches and consumed one at a time by (scalar) fuzz and by
+    # uniform -- see _standardNormal() and _standardUniform(); only used if
+    # this numpy's normal(mu, s) and uniform(a, b) are exactly mu + s * z and
+    # a + (b - a) * u for the same standard variates z and u
+    _normal_buffers:   list[list[float]] = []
+    _uniform_buffers:  list[list[float]] = []
+    _buffer_variates:  bool = False
+    _buffer_size:      int  = 4096
+
     ############################################################################
     @classmethod
     def initializeStreams(cls) -> None:
@@ -69,8 +81,77 @@ class RNG:
         rng = MT19937(Parameters.INITIAL_SEED)  # Mersenne twister
         for i in range(len(Stream)):
             cls._streams.append(Generator(rng.jumped(i)))
+        cls._normal_buffers  = [[] for i in range(len(Stream))]
+        cls._uniform_buffers = [[] for i in range(len(Stream))]
+        cls._buffer_variates = cls._variatesAreAffine()
         cls._initialized = True
 
+    ############################################################################
+    @staticmethod
+    def _variatesAreAffine() -> bool:
+        ''' static method to check, on throwaway generators, that numpy's
+            normal(mu, s) gives exactly mu + s * z, and uniform(a, b) exactly
+            a + (b - a) * u, for the same standard variates z and u (i.e., that
+            the multiply-add is not fused or reordered in this numpy build), so
+            that buffered standard variates reproduce exactly the values of
+            the unbuffered draws
+        Returns:
+            True if buffered standard variates can be used; False o/w
+        '''
+        direct = Generator(MT19937(12345))
+        buffer = Generator(MT19937(12345)).standard_normal(256).tolist()
+        for i in range(256):
+            mu = 0.1 + i * 0.37
+            s  = mu * 0.173
+            if direct.normal(mu, s) != mu + s * buffer[i]:
+                return False
+        direct = Generator(MT19937(12345))
+        buffer = Generator(MT19937(12345)).random(256).tolist()
+        for i in range(256):
+            a = 0.1 + i * 0.37
+            b = a * 1.173
+            if direct.uniform(a, b) != a + (b - a) * buffer[i]:
+                return False
+        return True
+
+    ############################################################################
+    @classmethod
+    def _standardNormal(cls, which_stream: Stream) -> float:
+        ''' class-level method to return the next standard normal variate of
+            the given stream, refilling that stream's buffer with one batched
+            draw when empty; the variates come out in the same order (and so
+            are the same values) as successive scalar draws from the stream
+        Parameters:
+            which_stream: named entry from Stream class
+        Returns:
+            a floating point value drawn from a normal(0,1) distribution
+        '''
+        buffer = cls._normal_buffers[which_stream.value]
+        if not buffer:
+            # stored in reverse so that the next variate is popped off the end
+            batch = cls._streams[which_stream.value].standard_normal(cls._buffer_size)
+            buffer.extend(batch[::-1].tolist())
+        return buffer.pop()
+
+    ############################################################################
+    @classmethod
+    def _standardUniform(cls, which_stream: Stream) -> float:
+        ''' class-level method to return the next [0,1) uniform variate of the
+            given stream, refilling that stream's buffer with one batched draw
+            when empty; the variates come out in the same order (and so are
+            the same values) as successive scalar draws from the stream
+        Parameters:
+            which_stream: named entry from Stream class
+        Returns:
+            a floating point value drawn from a uniform [0,1) distribution
+        '''
+        buffer = cls._uniform_buffers[which_stream.value]
+        if not buffer:
+            # stored in reverse so that the next variate is popped off the end
+            batch = cls._streams[which_stream.value].random(cls._buffer_size)
+            buffer.extend(batch[::-1].tolist())
+        return buffer.pop()
+
     ############################################################################
     @classmethod
     def randint(cls, a: int, b: int, which_stream: Stream) -> numpy.int64:
@@ -122,9 +203,18 @@ class RNG:
         Returns:
             a uniformly generated floating point value in either [a,b) or (a,b)
         '''
+        # (a stream drawn from here should not also be drawn from via random(),
+        # as uniforms come from a per-stream buffer -- see _standardUniform)
         if not isinstance(which_stream, Stream):
             raise TypeError(f"in RNG.uniform, which_stream must be of type Stream, not {type(which_stream)}")
         if not cls._initialized: cls.initializeStreams()
+        if cls._buffer_variates:
+            # same values as uniform(a,b) -- see _variatesAreAffine
+            value = a + (b - a) * cls._standardUniform(which_stream)
+            if exclude_a:
+                while value == a:
+                    value = a + (b - a) * cls._standardUniform(which_stream)
+            return value
         value = cls._streams[which_stream.value].uniform(a,b)
         if exclude_a:
             while value == a:
@@ -133,20 +223,24 @@ class RNG:
     
     ############################################################################
     @classmethod
-    def exponential(cls, mu: float, which_stream: Stream) -> numpy.float64:
+    def exponential(cls, mu: float, which_stream: Stream, size: int or tuple = None) \
+            -> numpy.float64 or numpy.ndarray:
         ''' Class-level method to generate variates drawn from an exponential
             distribution with given mean mu.
         Parameters:
             mu: float representing the mean (scale), not rate (e.g., avt time
                 b/w arrivals rather arrivals per unit time)
             which_stream: named entry from Stream class
+            size: if given, the number (or shape) of variates to generate at
+                once (default None generates a single variate)
         Returns:
-            a floating point value drawn from an exponential(mu) distribution
+            a floating point value drawn from an exponential(mu) distribution,
+            or an array of such values if size is given
         '''
         if not isinstance(which_stream, Stream):
             raise TypeError(f"in RNG.exponential, which_stream must be of type Stream, not {type(which_stream)}")
         if not cls._initialized: cls.initializeStreams()
-        return cls._streams[which_stream.value].exponential(mu)  # expects mean, not rate
+        return cls._streams[which_stream.value].exponential(mu, size)  # expects mean, not rate
 
     ############################################################################
     @classmethod
@@ -167,24 +261,29 @@ class RNG:
     
     ############################################################################
     @classmethod
-    def normal(cls, mu: float, s: float, which_stream: Stream) -> numpy.float64:
+    def normal(cls, mu: float, s: float, which_stream: Stream, size: int or tuple = None) \
+            -> numpy.float64 or numpy.ndarray:
         ''' Class-level method to generate variates drawn from a normal
             distribution with mean mu and standard deviation s.
         Parameters:
             mu: float value for the normal's mean parameter
             s: float value for the normal's standard deviation parameter
             which_stream: named entry from Stream class
+            size: if given, the number (or shape) of variates to generate at
+                once (default None generates a single variate)
         Returns:
-            a floating point value drawn from a normal(mu,s) distribution
+            a floating point value drawn from a normal(mu,s) distribution, or
+            an array of such values if size is given
         '''
         if not isinstance(which_stream, Stream):
             raise TypeError(f"in RNG.normal, which_stream must be of type Stream, not {type(which_stream)}")
         if not cls._initialized: cls.initializeStreams()
-        return cls._streams[which_stream.value].normal(mu, s)
+        return cls._streams[which_stream.value].normal(mu, s, size)
     
     ############################################################################
     @classmethod
-    def fuzz(cls, mean: float, fuzz_pct: float, which_stream: Stream) -> numpy.float64:
+    def fuzz(cls, mean: float, fuzz_pct: float, which_stream: Stream, size: int or tuple = None) \
+            -> numpy.float64 or numpy.ndarray:
         ''' class-level method to fuzz a particular value given a mean and some
             fuzz pct. Uses normal for fuzzing: given the fuzz pct f relative
             to mean m:
@@ -195,13 +294,35 @@ class RNG:
             mean: floating point value for the normal distribution's mean parameter
             fuzz_pct: floating point fuzz pct (see description above)
             which_stream: named entry from Stream class
+            size: if given, the number (or shape) of fuzzed values to generate
+                using a single vectorized draw (default None generates one);
+                a given stream should be fuzzed either always with or always
+                without size, as single values come from a per-stream buffer
         Returns:
-            floating point value of appropriately fuzzed normal
+            floating point value of appropriately fuzzed normal, or an array
+            of such values if size is given
         '''
         if not isinstance(which_stream, Stream):
             raise TypeError(f"in RNG.fuzz, which_stream must be of type Stream, not {type(which_stream)}")
         sd = (mean * fuzz_pct) / 2
+        if size is not None:
+            # keep the first n non-negative variates of the stream, in order,
+            # drawing only as many more as are still needed -- this gives
+            # exactly the values (and leaves the stream in exactly the state)
+            # that n successive scalar calls below would
+            n = int(numpy.prod(size))
+            values = cls.normal(mean, sd, which_stream, n)
+            values = values[values >= 0]
+            while len(values) < n:
+                more   = cls.normal(mean, sd, which_stream, n - len(values))
+                values = numpy.concatenate((values, more[more >= 0]))
+            return values.reshape(size)
+        if not cls._initialized: cls.initializeStreams()
         value = -1
+        if cls._buffer_variates:
+            while value < 0:  # same values as normal(mean, sd) -- see _variatesAreAffine
+                value = mean + sd * cls._standardNormal(which_stream)
+            return value
         while value < 0:  # there are better ways to ensure not negative... :(
             value = cls.normal(mean, sd, which_stream)
         return value
@@ -209,7 +330,7 @@ class RNG:
     #############################################################################
     # NEW VERSION OF divfuzz AFTER SPRING 2016 MEETING
     @classmethod
-    def divfuzz(cls, value: float, clade: 'Clade', which_stream: Stream) -> tuple[numpy.float64, MutationType]:
+    def divfuzz(cls, value: float, clade: 'Clade', which_stream: Stream) -> tuple[numpy.float64, int]:
         ''' class-level method Method to fuzz a particular value on symbiont division
 
             Approach:
@@ -245,15 +366,18 @@ class RNG:
                    specific phenotypic mutation probabilities)
             which_stream: named entry from Stream class
         Returns:
-            Feturns the floating-point fuzz amount (which may be zero in the
-            case of no phenotypic mutation), which must be added or subtracted
-            on the calling side (in symbiont.py).
+            a tuple containing the floating-point fuzz amount (which may be
+            zero in the case of no phenotypic mutation) and the sign of the
+            mutation: +1 if deleterious, -1 if beneficial, 0 if no mutation
+            (see MutationType); the calling side (in symbiont.py) multiplies
+            the fuzz amount by the sign, negated where a deleterious mutation
+            subtracts, rather than branching on the mutation type
         '''
         if not isinstance(which_stream, Stream):
             raise TypeError(f"in RNG.divfuzz, which_stream must be of type Stream, not {type(which_stream)}")
         if not cls._initialized: cls.initializeStreams()
     
-        mutation = MutationType.NO_MUTATION # default
+        sign     = 0  # default -- MutationType.NO_MUTATION
         fuzzamt  = 0
 
         phenotypic_mutation_prob = cls.random(which_stream)
@@ -274,7 +398,7 @@ class RNG:
                                         which_stream)
                 fuzzamt = (value * variate/100.0)
                 #print(">>>>>>>>> DEL= ",fuzzamt)
-                mutation = MutationType.DELETERIOUS
+                sign = +1  # MutationType.DELETERIOUS
             else:
                 # mutation will be a beneficial one: Gamma(2,1/1.795) will give
                 # 75% of value 1.5 or less -- use the generated value z as the
@@ -290,9 +414,9 @@ class RNG:
                                         which_stream)
                     fuzzamt = (value * variate/100.0)
                 #print(">>>>>>>>> BEN= ",fuzzamt)
-                mutation = MutationType.BENEFICIAL
+                sign = -1  # MutationType.BENEFICIAL
 
-        return (fuzzamt, mutation)
+        return (fuzzamt, sign)
 
     #############################################################################
     @classmethod
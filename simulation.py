@@ -43,6 +43,10 @@ class Simulation:
     _num_cols                     : int                 = None
     _sponge                       : Sponge              = None
     _event_list                   : EventList           = None
+    _num_pending_arrivals         : int                 = None
+
+    # number of arrivals whose times are drawn (and scheduled) at once
+    _arrival_batch_size           : int                 = 1024
 
     ########################
     @classmethod
@@ -81,6 +85,25 @@ class Simulation:
             for i in range(Parameters.NUM_CLADES):
                 cls._prev_num_symbionts_per_clade[i] = cls._num_symbionts_per_clade[i]
 
+    ##################################
+    @classmethod
+    def scheduleArrivals(cls, start_time: float) -> None:
+        ''' pre-draw a batch of exponential interarrival times in a single
+            vectorized call, and schedule the corresponding arrival events
+            using one bulk insert into the event list
+        Parameters:
+            start_time: floating-point time from which the batch of arrivals
+                is scheduled (i.e., time of the most recent arrival)
+        '''
+        interarrival_times = RNG.exponential(Parameters.AVG_TIME_BETWEEN_ARRIVALS, \
+            Stream.ARRIVALS, size = cls._arrival_batch_size)
+        # accumulate one arrival at a time starting from start_time, so each
+        # arrival time is exactly the previous arrival time + interarrival time
+        arrival_times = numpy.cumsum(numpy.concatenate(([start_time], interarrival_times)))[1:]
+        cls._event_list.bulkInsert( \
+            [Event.acquire(time, EventType.ARRIVAL, symbiont = None) for time in arrival_times])
+        cls._num_pending_arrivals = len(arrival_times)
+
     ################################################################################
     @classmethod
     def run(cls) -> None:
@@ -106,6 +129,7 @@ class Simulation:
         # parse the simulation parameters provided in the input CSV file
         Parser.parseCSVInput(cls._input_csv_fname)
         Symbiont.computeCumulativeCladeProportions()
+        Symbiont.bindClades()
         ################################################################
 
         RNG.initializeStreams()
@@ -116,6 +140,9 @@ class Simulation:
         if Parameters.WRITE_LOGGING_INFO:
             logging.basicConfig(format = '%(message)s', level = logging.DEBUG,\
                 filename = Parameters.LOG_FILENAME, filemode = 'w')
+        # whether debug logging is on, checked once here so that the per-event
+        # debug messages below are not even built (str, f-strings) when off
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
     
         if Parameters.WRITE_CSV_INFO:
             Symbiont.openCSVFile(Parameters.CSV_FILENAME)
@@ -151,10 +178,8 @@ class Simulation:
         #allow_typical_arrivals : bool = False
     
         if allow_typical_arrivals:
-            # schedule the first arrival to the system
-            time  = RNG.exponential(Parameters.AVG_TIME_BETWEEN_ARRIVALS, Stream.ARRIVALS)
-            event = Event(time, EventType.ARRIVAL, symbiont = None)
-            cls._event_list.insertEvent(event)
+            # schedule the first (batch of) arrivals to the system
+            cls.scheduleArrivals(0.0)
     
         num_initial_agents : int = Parameters.NUM_INITIAL_SYMBIONTS
         if Parameters.INITIAL_PLACEMENT.lower() == "random":
@@ -197,13 +222,13 @@ class Simulation:
             open_cell.setSymbiont(symbiont, cls._current_time)
     
             next_event_time, next_event_type = symbiont.getNextEvent()
-            new_event = Event(next_event_time, next_event_type, symbiont)
+            new_event = Event.acquire(next_event_time, next_event_type, symbiont)
             cls._event_list.insertEvent(new_event)
             cls._num_symbionts += 1
             cls._num_symbionts_per_clade[which_clade] += 1
             #num_symbionts_per_clade[symbiont._clade_number] += 1
 
-            logging.debug(str(symbiont))
+            if debug: logging.debug(str(symbiont))
     
         ###################################################################################
         ###################################################################################
@@ -230,6 +255,9 @@ class Simulation:
         #############################################################
         # enter the main simulation loop
         while event is not None and event.getTime() < cls._end_time:
+            # the (at most one) new event produced by handling this event that
+            # is not yet in the event list -- see end of loop
+            follow_up_event = None
             ###################################
             cls._current_time = event.getTime()
             event_type = event.getType()
@@ -241,129 +269,125 @@ class Simulation:
             ###################################
             if event_type == EventType.ARRIVAL:
                 #
-                logging.debug('ARRIVAL @ t=%f' % (cls._current_time))
+                if debug: logging.debug('ARRIVAL @ t=%f' % (cls._current_time))
                 # handle a symbiont arrival to the sponge -- 
                 # check for affinity and open cell...
                 symbiont = Symbiont.generateArrival(cls._current_time, cls._num_symbionts)
                 if symbiont is not None:
                     # sufficient affinity to infect, so set up next event for symbiont
                     next_time, next_type = symbiont.getNextEvent()
-                    new_event = Event(next_time, next_type, symbiont)
-                    cls._event_list.insertEvent(new_event)
+                    follow_up_event = Event.acquire(next_time, next_type, symbiont)
                     cls._num_symbionts += 1
                     cls._num_symbionts_per_clade[symbiont.getCladeNumber()] += 1
                 
-                logging.debug(str(symbiont))
+                if debug: logging.debug(str(symbiont))
     
-                # schedule the next arrival
-                next_time = cls._current_time + \
-                    RNG.exponential(Parameters.AVG_TIME_BETWEEN_ARRIVALS, Stream.ARRIVALS)
-                new_event = Event(next_time, EventType.ARRIVAL, symbiont = None)
-                cls._event_list.insertEvent(new_event)
+                # schedule the next batch of arrivals once this batch is used up
+                cls._num_pending_arrivals -= 1
+                if cls._num_pending_arrivals == 0:
+                    cls.scheduleArrivals(cls._current_time)
                 #
             ####################################
             elif event_type == EventType.END_G0:
                 #
-                logging.debug('END G0 @ t=%f' % (cls._current_time))
+                if debug: logging.debug('END G0 @ t=%f' % (cls._current_time))
                 # handle a symbiont's end of G0 event
                 symbiont.endOfG0(cls._current_time)
                 # set up the next event for this symbiont -- G1SG2M or exit or digestion...
                 next_time, next_type = symbiont.getNextEvent()
-                new_event = Event(next_time, next_type, symbiont)
-                cls._event_list.insertEvent(new_event)
+                follow_up_event = Event.acquire(next_time, next_type, symbiont)
                 #
-                logging.debug(str(symbiont))
+                if debug: logging.debug(str(symbiont))
                 #
             ########################################
             elif event_type == EventType.END_G1SG2M:
                 #
-                logging.debug('END G1SG2M @ t=%f' % (cls._current_time))
+                if debug: logging.debug('END G1SG2M @ t=%f' % (cls._current_time))
                 # handle a symbiont's end of G1SG2M event, which may result in a
                 # built-in eviction event (see symbiont.py endOfG1SG2M())
                 status, child = symbiont.endOfG1SG2M(cls._current_time)
                 #
-                logging.debug(f'status @ end of G1SG2M={status.name}')
-                logging.debug(str(symbiont))
-                logging.debug(str(child))
+                if debug: logging.debug(f'status @ end of G1SG2M={status.name}')
+                if debug: logging.debug(str(symbiont))
+                if debug: logging.debug(str(child))
                 #
                 if status == SymbiontState.CHILD_INFECTS_OUTSIDE:
-                    logging.debug(f'\t{status.name}')
+                    if debug: logging.debug(f'\t{status.name}')
                     child.csvOutputOnExit(cls._current_time, status)
                     # set up next events for parent (symbiont) only
                     next_time, next_type = symbiont.getNextEvent()
-                    new_event = Event(next_time, next_type, symbiont)
-                    cls._event_list.insertEvent(new_event)
+                    follow_up_event = Event.acquire(next_time, next_type, symbiont)
+                    Symbiont.release(child)  # child has exited, so recycle it
                     #
                 elif status == SymbiontState.PARENT_EVICTED:
-                    logging.debug(f'\t{status.name}')
+                    if debug: logging.debug(f'\t{status.name}')
                     symbiont.csvOutputOnExit(cls._current_time, status)
                     # set up the next event for the child only 
                     # (who now occupies the cell)
                     next_time, next_type = child.getNextEvent()
-                    new_event = Event(next_time, next_type, child)
-                    cls._event_list.insertEvent(new_event)
+                    follow_up_event = Event.acquire(next_time, next_type, child)
                     #
-                    logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                    if debug: logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                    Symbiont.release(symbiont)  # symbiont has exited, so recycle it
                     #
                 elif status == SymbiontState.PARENT_INFECTS_OUTSIDE:
-                    logging.debug(f'\t{status.name}')
+                    if debug: logging.debug(f'\t{status.name}')
                     symbiont.csvOutputOnExit(cls._current_time, status)
                     # set up the next event for the child only (who now occupies the cell)
                     next_time, next_type = child.getNextEvent()
-                    new_event = Event(next_time, next_type, child)
-                    cls._event_list.insertEvent(new_event)
+                    follow_up_event = Event.acquire(next_time, next_type, child)
                     #
-                    logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                    if debug: logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                    Symbiont.release(symbiont)  # symbiont has exited, so recycle it
                     #
                 elif status == SymbiontState.CHILD_EVICTED:
-                    logging.debug(f'\t{status.name}')
+                    if debug: logging.debug(f'\t{status.name}')
                     child.csvOutputOnExit(cls._current_time, status)
                     # set up the next event for the parent only (who still occupies the cell)
                     next_time, next_type = symbiont.getNextEvent()
-                    new_event = Event(next_time, next_type, symbiont)
-                    cls._event_list.insertEvent(new_event)
+                    follow_up_event = Event.acquire(next_time, next_type, symbiont)
                     #
-                    logging.debug(f'RT = {cls._current_time - child.getArrivalTime()} ({child.getCladeNumber()})')
+                    if debug: logging.debug(f'RT = {cls._current_time - child.getArrivalTime()} ({child.getCladeNumber()})')
+                    Symbiont.release(child)  # child has exited, so recycle it
                     #
                 elif status == SymbiontState.BOTH_STAY:
-                    logging.debug(f'\t{status.name}')
+                    if debug: logging.debug(f'\t{status.name}')
                     # set up the next events for both symbionts
                     next_time, next_type = symbiont.getNextEvent()
-                    new_event = Event(next_time, next_type, symbiont)
+                    new_event = Event.acquire(next_time, next_type, symbiont)
                     cls._event_list.insertEvent(new_event)
                     #
                     next_time, next_type = child.getNextEvent()
-                    new_event = Event(next_time, next_type, child)
-                    cls._event_list.insertEvent(new_event)
+                    follow_up_event = Event.acquire(next_time, next_type, child)
                     #
                     cls._num_symbionts += 1
                     cls._num_symbionts_per_clade[child.getCladeNumber()] += 1
                     #
                 elif status == SymbiontState.PARENT_NO_AFFINITY:
-                    logging.debug(f'\t{status.name}')
+                    if debug: logging.debug(f'\t{status.name}')
                     symbiont.csvOutputOnExit(cls._current_time, status)
                     # set up the next event for the child only (who now occupies the cell)
                     next_time, next_type = child.getNextEvent()
-                    new_event = Event(next_time, next_type, child)
-                    cls._event_list.insertEvent(new_event)
+                    follow_up_event = Event.acquire(next_time, next_type, child)
                     #
-                    logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                    if debug: logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                    Symbiont.release(symbiont)  # symbiont has exited, so recycle it
                     #
                 elif status == SymbiontState.CHILD_NO_AFFINITY:
-                    logging.debug(f'\t{status.name}')
+                    if debug: logging.debug(f'\t{status.name}')
                     child.csvOutputOnExit(cls._current_time, status)
                     # set up the next event for the parent only (who still occupies the cell)
                     next_time, next_type = symbiont.getNextEvent()
-                    new_event = Event(next_time, next_type, symbiont)
-                    cls._event_list.insertEvent(new_event)
+                    follow_up_event = Event.acquire(next_time, next_type, symbiont)
                     #
-                    logging.debug(f'RT = {cls._current_time - child.getArrivalTime()} ({child.getCladeNumber()})')
+                    if debug: logging.debug(f'RT = {cls._current_time - child.getArrivalTime()} ({child.getCladeNumber()})')
+                    Symbiont.release(child)  # child has exited, so recycle it
                     #
                 #
             #######################################
             elif event_type == EventType.DIGESTION:
                 #
-                logging.debug('DIGESTION @ t=%f' % (cls._current_time))
+                if debug: logging.debug('DIGESTION @ t=%f' % (cls._current_time))
                 # handle a symbiont-being-digested event
                 symbiont.digestion(cls._current_time)
                 prev_event_type = symbiont.getPrevEventType()
@@ -377,13 +401,14 @@ class Simulation:
                 #
                 # no further event updating for this symbiont -- the symbiont is gone!
                 #
-                logging.debug(str(symbiont))
-                logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                if debug: logging.debug(str(symbiont))
+                if debug: logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                Symbiont.release(symbiont)  # symbiont has exited, so recycle it
                 #
             #####################################
             elif event_type == EventType.ESCAPE:
                 #
-                logging.debug('ESCAPE @ t=%f' % (cls._current_time))
+                if debug: logging.debug('ESCAPE @ t=%f' % (cls._current_time))
                 # handle a symbiont-escaping-digestion event
                 symbiont.escape(cls._current_time)
                 prev_event_type = symbiont.getPrevEventType()
@@ -397,13 +422,14 @@ class Simulation:
                 #
                 # no further event updating for this symbiont -- the symbiont is gone!
                 #
-                logging.debug(str(symbiont))
-                logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                if debug: logging.debug(str(symbiont))
+                if debug: logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                Symbiont.release(symbiont)  # symbiont has exited, so recycle it
                 #
             ########################################
             elif event_type == EventType.DENOUEMENT:
                 #
-                logging.debug('DENOUEMENT @ t=%f' % (cls._current_time))
+                if debug: logging.debug('DENOUEMENT @ t=%f' % (cls._current_time))
                 # handle a symbiont-leaving-of-own-accord event
                 symbiont.denouement(cls._current_time)
                 prev_event_type = symbiont.getPrevEventType()
@@ -417,13 +443,21 @@ class Simulation:
                 #
                 # no further event updating for this symbiont -- the symbiont is gone!
                 #
-                logging.debug(str(symbiont))
-                logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                if debug: logging.debug(str(symbiont))
+                if debug: logging.debug(f'RT = {cls._current_time - symbiont.getArrivalTime()} ({symbiont.getCladeNumber()})')
+                Symbiont.release(symbiont)  # symbiont has exited, so recycle it
                 #
             # 
     
-            logging.debug('>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>')
-            event = cls._event_list.getNextEvent()
+            if debug: logging.debug('>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>')
+            # this event has been handled, so recycle it before moving on;
+            # when handling produced a follow-up event, insert it and pop the
+            # next event using a single heap operation
+            Event.release(event)
+            if follow_up_event is not None:
+                event = cls._event_list.insertAndGetNextEvent(follow_up_event)
+            else:
+                event = cls._event_list.getNextEvent()
     
         # end of main simulation loop
         #######################################################
@@ -1,49 +1,60 @@
+import numpy
 from parameters import Parameters
 from rng_mt19937 import *
 
+# (row,col) offsets of the Moore neighborhood of a cell, in the order used for
+# each Cell's tuple of neighbors (see Sponge._linkNeighbors)
+MOORE_OFFSETS : tuple[tuple[int,int], ...] = ((-1,-1),(-1,0),(-1,1), \
+                                              ( 0,-1),       ( 0,1), \
+                                              ( 1,-1),( 1,0),( 1,1))
+
+# residence times per cell are tracked as integer ticks (of 1e-6 days) rather
+# than floating-point days, with a sentinel tick value for "not occupied"
+TICKS_PER_DAY : int = 1_000_000
+NOT_OCCUPIED  : int = numpy.iinfo(numpy.int64).min
+
 ################################################################################
 class Cell:
     ''' class to model a single host cell, having a (row,col) position in a 2D
     grid of host cells, and able to provide occupancy for an algal symbiont wil
-    requiring a cell-specific photosynthetic demand.
+    requiring a cell-specific photosynthetic demand.  A Cell is a lightweight
+    view onto its entry in the Sponge's per-cell (columnar) arrays; only the
+    occupying symbiont reference is stored per Cell object.
     '''
-    __slots__ = ('_row', \
+    __slots__ = ('_sponge', \
+                 '_row', \
                  '_col', \
+                 '_index', \
                  '_demand', \
-                 '_occupied', \
-                 '_symbiont', \
-                 '_last_occupied_time', 
-                 '_sum_residence_time', 
-                 '_num_occupants')
+                 '_neighbors', \
+                 '_symbiont')
 
-    ###############################################
-    def __init__(self, row: int, col: int) -> None:
+    ##################################################################
+    def __init__(self, sponge: 'Sponge', row: int, col: int) -> None:
         ''' initializer method for a host cell object
         Parameters:
+            sponge: the Sponge object holding the per-cell arrays
             row: integer valued row number in [0,num_rows - 1]
             col: integer valued column number in [0,num_cols - 1]
         '''
-        self._row      : int        = row
-        self._col      : int        = col
-        self._demand   : float      = self.computeDemand()
-        self._occupied : bool       = False
-        self._symbiont : 'Symbiont' = None   # null
+        self._sponge   : 'Sponge'        = sponge
+        self._row      : int             = row
+        self._col      : int             = col
+        self._index    : tuple[int,int]  = (row, col)  # index into the sponge arrays
+        self._symbiont : 'Symbiont'      = None        # null
+        self._neighbors: tuple['Cell' or None, ...] = () # set by Sponge._linkNeighbors
 
-        # used to track observation-persistent and time-persistent statistics of 
-        # residence time per cell (and eventually, in simulation.py, per row);
-        # Note that:
-        #      _sum_residence_time / MAX_T  = prop. of time cell is occupied
-        #      _sum_residence_time / # occupants = avg time per symbiont occupation
-        self._last_occupied_time = INFINITY
-        self._sum_residence_time = 0
-        self._num_occupants = 0
+        # demand never changes once the sponge is built, so keep a copy here
+        # rather than indexing the sponge's demand array on every access
+        self._demand   : numpy.float64   = sponge._demand[row, col]
 
     ################################
     ''' simple accessors/getters '''
     def getDemand(self)   -> float:              return self._demand
     def getRowCol(self)   -> tuple[int,int]:     return (self._row, self._col)
     def getSymbiont(self) -> 'Symbiont' or None: return self._symbiont
-    def isOccupied(self)  -> bool:               return self._occupied
+    def isOccupied(self)  -> bool:               return self._symbiont is not None
+    def getNeighbors(self) -> tuple['Cell' or None, ...]: return self._neighbors
 
     ######################################################
     def removeSymbiont(self, current_time: float) -> None:
@@ -51,13 +62,16 @@ class Cell:
         Parameters:
             current_time: the current time (as a float)
         '''
+        sponge = self._sponge
+        index  = self._index
         self._symbiont = None
-        self._occupied = False
-        # add to the residence time for this cell
-        assert(self._last_occupied_time != INFINITY)
-        self._sum_residence_time += (current_time - self._last_occupied_time)
-        self._num_occupants += 1
-        self._last_occupied_time = INFINITY
+        sponge._occupied[index] = False
+        # add to the residence time (in ticks) for this cell
+        assert(sponge._last_occupied_tick[index] != NOT_OCCUPIED)
+        sponge._sum_residence_ticks[index] += round(current_time * TICKS_PER_DAY) \
+                                              - sponge._last_occupied_tick[index]
+        sponge._num_occupants[index] += 1
+        sponge._last_occupied_tick[index] = NOT_OCCUPIED
 
     #########################################################################
     def setSymbiont(self, symbiont: 'Symbiont', current_time: float) -> None:
@@ -66,32 +80,20 @@ class Cell:
             symbiont: a Symbiont object
             current_time: the current time (as a float)
         '''
+        sponge = self._sponge
+        index  = self._index
+        current_tick = round(current_time * TICKS_PER_DAY)
         # it could be the case that we are swapping in a child symbiont
         # and evicting a parent, without ever calling removeSymbiont();
         # if that is the case, make sure to add in the unit-time rectangle
         # corresponding to the parent's time in the cell...
         if self._symbiont is not None:  # something was just evicted...
-            self._sum_residence_time += (current_time - self._last_occupied_time)
-            self._num_occupants += 1
+            sponge._sum_residence_ticks[index] += current_tick - sponge._last_occupied_tick[index]
+            sponge._num_occupants[index] += 1
 
         self._symbiont = symbiont
-        self._occupied = True
-        self._last_occupied_time = current_time   # new symbiont's residence starts now
-
-    #################################
-    def computeDemand(self) -> float:
-        ''' compute photosynthetic demand expected by this host cell per unit time
-        Returns:
-            the photosynthetic demand required by this host cell (as a float)
-        '''
-        ## 12 Apr 2016
-        # rather than fuzzing uniformly, use Normal with 95% of the data b/w 
-        # (mu +/- mu*f) -- see implementation in rng.py
-        m = Parameters.HOST_CELL_DEMAND
-        f = Parameters.HCD_FUZZ  # assume to be % of the mean
-        demand = RNG.fuzz(m, f, Stream.HOST_CELL_DEMAND)
-
-        return demand 
+        sponge._occupied[index] = True
+        sponge._last_occupied_tick[index] = current_tick  # new symbiont's residence starts now
 
     #########################
     def __str__(self) -> str:
@@ -106,11 +108,22 @@ class Cell:
 ################################################################################
 class Sponge:
     ''' This class implements the 2D sponge environment for a collection of host 
-        cells.  Essentially, this class is nothing more than a wrapper for a 2D
-        list of Cell references.
+        cells.  Per-cell state is stored column-wise, as one NumPy array per
+        quantity (of shape num_rows x num_cols), so that sponge-wide scans and
+        reductions need not visit each Cell object; Cell objects are views
+        onto these arrays, kept in a flat (row-major) list of Cell references.
     '''
 
-    __slots__ = ('_num_rows', '_num_cols', '_cells')
+    __slots__ = ('_num_rows', \
+                 '_num_cols', \
+                 '_stride', \
+                 '_cells', \
+                 '_demand', \
+                 '_occupied', \
+                 '_open', \
+                 '_last_occupied_tick', \
+                 '_sum_residence_ticks', \
+                 '_num_occupants')
 
     def __init__(self, num_rows: int, num_cols: int) -> None:
         ''' initializer for a Sponge object
@@ -120,9 +133,62 @@ class Sponge:
         '''
         self._num_rows = num_rows
         self._num_cols = num_cols
+        shape = (num_rows, num_cols)
+
+        # photosynthetic demand per host cell, drawn in a single vectorized call
+        self._demand = self._allocateDemands()
+
+        self._occupied = numpy.zeros(shape, dtype = numpy.bool_)
+        self._open     = numpy.empty(shape, dtype = numpy.bool_)  # scratch -- see _computeOpen
+
+        # used to track observation-persistent and time-persistent statistics of 
+        # residence time per cell (and eventually, in simulation.py, per row);
+        # Note that:
+        #      _sum_residence_ticks / MAX_T  = prop. of time cell is occupied
+        #      _sum_residence_ticks / # occupants = avg time per symbiont occupation
+        # (both times in ticks -- see TICKS_PER_DAY)
+        self._last_occupied_tick  = numpy.full(shape, NOT_OCCUPIED, dtype = numpy.int64)
+        self._sum_residence_ticks = numpy.zeros(shape, dtype = numpy.int64)
+        self._num_occupants      = numpy.zeros(shape, dtype = numpy.int64)
+
+        # assign the flat list of Cell references (views onto the arrays above),
+        # stored in row-major order so that the cell at (r,c) is at r*stride + c
+        self._stride = num_cols
+        self._cells  = [Cell(self, r, c) for r in range(num_rows) for c in range(num_cols)]
+        self._linkNeighbors()
 
-        # assign the 2D list of Cell references 
-        self._cells = [[Cell(r,c) for c in range(num_cols)] for r in range(num_rows)]
+    ##################################
+    def _linkNeighbors(self) -> None:
+        ''' gives each Cell the tuple of its Moore-neighborhood Cells, in the
+            order of MOORE_OFFSETS, wrapping horizontally (cols) but not
+            vertically (rows) since we are modeling only a slice of the sponge
+            canal; a neighbor above the top row or below the bottom row is None
+        '''
+        for cell in self._cells:
+            neighbors = []
+            for row_offset, col_offset in MOORE_OFFSETS:
+                row = cell._row + row_offset
+                if row < 0 or row >= self._num_rows:
+                    neighbors.append(None)
+                else:
+                    col = (cell._col + col_offset) % self._num_cols  # wrap the column
+                    neighbors.append(self._cells[row * self._stride + col])
+            cell._neighbors = tuple(neighbors)
+
+    ##############################################
+    def _allocateDemands(self) -> numpy.ndarray:
+        ''' compute photosynthetic demand expected by each host cell per unit
+            time, using one vectorized draw for the entire sponge (in row-major
+            order) rather than one draw per cell
+        Returns:
+            a (num_rows x num_cols) array of photosynthetic demands (floats)
+        '''
+        ## 12 Apr 2016
+        # rather than fuzzing uniformly, use Normal with 95% of the data b/w 
+        # (mu +/- mu*f) -- see implementation in rng.py
+        m = Parameters.HOST_CELL_DEMAND
+        f = Parameters.HCD_FUZZ  # assume to be % of the mean
+        return RNG.fuzz(m, f, Stream.HOST_CELL_DEMAND, size = (self._num_rows, self._num_cols))
 
     def getDimensions(self) -> tuple[int, int]:
         ''' returns the sponge dimensions
@@ -143,5 +209,70 @@ class Sponge:
         '''
         if row < 0 or row >= self._num_rows or col < 0 or col >= self._num_cols:
             raise ValueError(f"Error in Sponge.getCell: ({row},{col}) out of bounds")
-        cell = self._cells[row][col]
+        cell = self._cells[row * self._stride + col]
         return cell
+
+    def getCellUnchecked(self, row: int, col: int) -> Cell:
+        ''' returns the Cell object at the given row and column, without
+            checking bounds -- for use by internal loops whose row and column
+            values are already known to be in bounds (see getCell otherwise)
+        Parameters:
+            row: integer valued row of desired cell, in [0, num_rows - 1]
+            col: integer valued column of desired cell, in [0, num_cols - 1]
+        Returns:
+            Cell object @ (row,col)
+        '''
+        return self._cells[row * self._stride + col]
+
+    def _computeOpen(self) -> numpy.ndarray:
+        ''' fills (without allocating) the scratch array marking each open
+            (unoccupied) cell as True
+        Returns:
+            the (num_rows x num_cols) boolean array of open cells
+        '''
+        return numpy.logical_not(self._occupied, out = self._open)
+
+    def getOpenCellIndices(self) -> numpy.ndarray:
+        ''' finds all open (unoccupied) cells in the entire sponge using a
+            single whole-array scan of the occupancy array
+        Returns:
+            an array of the flat (row-major) indices of the open cells, in
+            increasing order -- see getCellByIndex
+        '''
+        return numpy.flatnonzero(self._computeOpen())
+
+    def getCellByIndex(self, index: int) -> Cell:
+        ''' returns the Cell object at the given flat (row-major) index, i.e.,
+            the cell at (index // num_cols, index % num_cols)
+        Parameters:
+            index: integer valued index in [0, num_rows * num_cols - 1]
+        Returns:
+            Cell object @ index
+        '''
+        return self._cells[index]
+
+    def getOpenCellPositions(self, min_row: int, max_row: int, min_col: int, max_col: int) \
+            -> tuple[numpy.ndarray, numpy.ndarray]:
+        ''' finds all open (unoccupied) cells within a section of the sponge
+            using a single whole-array scan of the occupancy array; note that
+            min_row and min_col are inclusive, max_row and max_col exclusive
+        Parameters:
+            min_row: the minimum row value of the section (inclusive)
+            max_row: the maximum row value of the section (exclusive)
+            min_col: the minimum col value of the section (inclusive)
+            max_col: the maximum col value of the section (exclusive)
+        Returns:
+            a tuple containing the arrays of rows and of cols of the open
+            cells, in row-major order
+        '''
+        rows, cols = numpy.nonzero(self._computeOpen()[min_row:max_row, min_col:max_col])
+        return (rows + min_row, cols + min_col)
+
+    def getOccupiedCells(self) -> list[Cell]:
+        ''' finds all occupied cells in the sponge using a single whole-array
+            scan of the occupancy array
+        Returns:
+            a list of the occupied Cell objects, in row-major order
+        '''
+        cells = self._cells
+        return [cells[i] for i in numpy.flatnonzero(self._occupied).tolist()]
@@ -1,12 +1,11 @@
 import logging
-import copy  # for copy constructor:
-    # http://stackoverflow.com/questions/1241148/copy-constructor-in-python
-    # http://pymotw.com/2/copy/
-from numpy import cumsum
-from parameters import *
-from rng_mt19937 import *
+from array import array
+from enum import IntEnum
+import numpy
+from parameters import Parameters, INFINITY
+from rng_mt19937 import RNG, Stream
 from event_list import Event, EventType
-from clade import *
+from clade import Clade
 from sponge import Cell
 
 ###############################################################################
@@ -44,11 +43,10 @@ from sponge import Cell
 #    self._my_clade                : an instance of the parent Clade of this symbiont
 #
 #    self._cells_at_division       : list of number of open cells available at each mitosis
-#    self._cells_inhabited         : list of all cells inhabited
-#    self._inhabit_times           : list of times each cell above inhabited
-#    self._hcds_of_cells_inhabited : list of photosynthate demand of each cell inhabited
-#    self._g0_times                : list of g0 times for this symbiont
-#    self._g1sg2m_times            : list of g1sg2m times for this symbiont
+#    self._trail                   : list of all cells inhabited, as tuples of
+#                                    (row, col, time inhabited, photosynthate demand)
+#    self._g0_times                : array (of doubles) of g0 times for this symbiont
+#    self._g1sg2m_times            : array (of doubles) of g1sg2m times for this symbiont
 #    self._num_divisions           : number of successful divisions for this symbiont
 #
 # Methods of interest (all but one public-facing) used in the simulation:
@@ -81,7 +79,9 @@ from sponge import Cell
 ###############################################################################
 
 ################################################################################
-class SymbiontState(Enum):
+class SymbiontState(IntEnum):
+    # (an IntEnum, like EventType, so members are plain ints underneath;
+    # output always uses the member's .name)
     # used in division cases on border
     CELL_OUTSIDE_ENVIRONMENT = -1
     # to identify Symbiont's arrival method
@@ -107,6 +107,23 @@ class SymbiontState(Enum):
     DENOUEMENT_IN_G0         = 16
     DENOUEMENT_IN_G1SG2M     = 17
 
+# module-level aliases for the states checked on every event, so that the
+# hot methods below need not look up the member on the class each time
+_IN_G0     = SymbiontState.IN_G0
+_IN_G1SG2M = SymbiontState.IN_G1SG2M
+
+# likewise for the event types chosen among in _setNextEvent
+_END_G0     = EventType.END_G0
+_END_G1SG2M = EventType.END_G1SG2M
+_ESCAPE     = EventType.ESCAPE
+_DIGESTION  = EventType.DIGESTION
+_DENOUEMENT = EventType.DENOUEMENT
+
+# template for one row of per-symbiont CSV output -- one %s per field written
+# by Symbiont.csvOutputOnExit (%s gives the same text as str() for each field)
+_CSV_NUM_FIELDS : int = 25
+_CSV_ROW_FORMAT : str = ','.join(['%s'] * _CSV_NUM_FIELDS) + '\n'
+
 ################################################################################
 class Symbiont:
     ''' class to implement an algal symbiont in the agent-based simulation '''
@@ -120,14 +137,12 @@ class Symbiont:
                  '_arrival_time',            \
                  '_cell',                    \
                  '_cells_at_division',       \
-                 '_cells_inhabited',         \
+                 '_clade_fast',              \
                  '_clade_number',            \
                  '_g0_times',                \
                  '_g1sg2m_times',            \
-                 '_hcds_of_cells_inhabited', \
                  '_how_arrived',             \
                  '_id',                      \
-                 '_inhabit_times',           \
                  '_mitotic_cost_rate',       \
                  '_my_clade',                \
                  '_next_event_time',         \
@@ -144,11 +159,52 @@ class Symbiont:
                  '_time_of_denouement',      \
                  '_time_of_next_end_g0',     \
                  '_time_of_next_end_g1sg2m', \
+                 '_trail',                   \
                  )
 
+    # instance variables and type (hints), in one place for easy reference;
+    # these are annotations only -- the actual values are all assigned in
+    # __init__ (or _SymbiontCopy) and/or later
+    _id:                      int
+    _clade_number:            int
+    _my_clade:                Clade
+    _clade_fast:              tuple
+    _cell:                    Cell
+    _how_arrived:             SymbiontState
+    _parent_id:               int
+    _agent_zero:              int
+    _num_divisions:           int
+    _mitotic_cost_rate:       float
+    _production_rate:         float
+    _photosynthate_surplus:   float
+    _surplus_on_arrival:      float
+    _trail:                   list[tuple[int,int,float,float]]
+    _g0_times:                array       # typecode 'd'
+    _g1sg2m_times:            array       # typecode 'd'
+    #_cells_at_division:       list[int]
+
+    _arrival_time:            float
+    _time_of_escape:          float
+    _time_of_digestion:       float
+    _time_of_denouement:      float
+    _time_of_next_end_g0:     float
+    _time_of_next_end_g1sg2m: float
+
+    _prev_event_time:         float
+    _prev_event_type:         EventType
+    _next_event_time:         float
+    _next_event_type:         EventType
+
     # class-level variables
     sponge : 'Sponge' = None   # set in simulation.py main function when symbionts are created
-    clade_cumulative_proportions : list[float] = [None] * len(Parameters.CLADE_PROPORTIONS)
+    clade_cumulative_proportions : numpy.ndarray = None  # see computeCumulativeCladeProportions
+    _clade_cumulative_scan : tuple[float, ...] or None = None  # same, for a linear scan (few clades)
+    _CLADE_SCAN_MAX : int = 8  # max number of clades for which to use the linear scan
+    _clades      : tuple[Clade, ...] = ()  # Clade objects by clade number -- see bindClades
+    _clade_fasts : tuple[tuple, ...] = ()  # Clade.fast() tuples by clade number
+    _row_divisor : float = 1.0             # N-1 for N sponge rows -- see bindClades
+    _last_row    : int   = 0               # index of the bottom sponge row
+    _num_cells   : int   = 0               # total number of host cells in the sponge
     _count : int      = 0      # used to count total number of symbionts
 
     # class-level variables for writing per-symbiont statistics; whether to
@@ -157,6 +213,50 @@ class Symbiont:
     _write_csv:  bool                = False  
     _csv_writes: int                 = 0
     _csv_file:   '_io.TextIOWrapper' = None
+    # rows are collected here and written to the file in chunks
+    _csv_buffer:       list[str]     = []
+    _csv_buffer_limit: int           = 4096    # rows per write
+
+    # the per-symbiont history lists (cells inhabited, g0 times, etc.) are only
+    # ever read when writing the CSV information; when not writing it, every
+    # symbiont shares this empty placeholder instead and nothing is recorded
+    _NO_CSV:     tuple               = ()
+
+    # class-level free list of exited Symbiont objects available for reuse,
+    # bounded in size, so that arrivals and divisions need not allocate (and
+    # later free) a new object every time -- see __new__() and release()
+    _pool:          list['Symbiont'] = []
+    _pool_max_size: int              = 4096
+
+    ############################################################################
+    def __new__(cls, *args, **kwargs) -> 'Symbiont':
+        ''' allocator for Symbiont objects, reusing a previously released
+            Symbiont object if one is available; every slot of the returned
+            object is (re-)assigned by __init__ or by _SymbiontCopy
+        Returns:
+            a Symbiont object, not yet initialized
+        '''
+        if cls._pool:
+            return cls._pool.pop()
+        return super().__new__(cls)
+
+    ############################################################################
+    @classmethod
+    def release(cls, symbiont: 'Symbiont') -> None:
+        ''' class-level method to return a symbiont that has exited the
+            simulation (and so has no pending event and no cell) for reuse
+        Parameters:
+            symbiont: a Symbiont object no longer referenced by the simulation
+        '''
+        if len(cls._pool) >= cls._pool_max_size:
+            return
+        # drop references so the pool does not keep cells or history alive
+        symbiont._cell = None
+        # (__init__ and _SymbiontCopy assign fresh history containers on reuse)
+        symbiont._trail        = cls._NO_CSV
+        symbiont._g0_times     = cls._NO_CSV
+        symbiont._g1sg2m_times = cls._NO_CSV
+        cls._pool.append(symbiont)
 
     ############################################################################
     def __init__(self, clade_number: int, cell: Cell, current_time: float) -> None:
@@ -176,46 +276,12 @@ class Symbiont:
         if clade_number < 0 or clade_number >= Parameters.NUM_CLADES:
             raise ValueError(f"Error in Symbiont: invalid clade {clade_number}")
 
-        ########################################################################
-        # define instance variables and type (hints) so they are in one place
-        # for easy reference; actual values will be assigned below and/or later
-        self._id:                      int           = None
-        self._clade_number:            int           = None
-        self._my_clade:                Clade         = None
-        self._cell:                    Cell          = None
-        self._how_arrived:             SymbiontState = None
-        self._parent_id:               int           = None
-        self._agent_zero:              int           = None
-        self._num_divisions:           int           = None
-        self._mitotic_cost_rate:       float         = None
-        self._production_rate:         float         = None
-        self._photosynthate_surplus:   float         = None
-        self._surplus_on_arrival:      float         = None
-        self._cells_inhabited:         list[str]     = None
-        self._inhabit_times:           list[float]   = None
-        self._hcds_of_cells_inhabited: list[float]   = None 
-        self._g0_times:                list[float]   = None
-        self._g1sg2m_times:            list[float]   = None
-        #self._cells_at_division:       list[int]     = None
-
-        self._arrival_time:            float         = None
-        self._time_of_escape:          float         = None
-        self._time_of_digestion:       float         = None
-        self._time_of_denouement:      float         = None
-        self._time_of_next_end_g0:     float         = None
-        self._time_of_next_end_g1sg2m: float         = None
-
-        self._prev_event_time:         float         = None
-        self._prev_event_type:         EventType     = None
-        self._next_event_time:         float         = None
-        self._next_event_type:         EventType     = None
-        ########################################################################
-
         self._id = Symbiont._count
         Symbiont._count += 1
 
         self._clade_number  = clade_number
-        self._my_clade      = Clade.getClade(clade_number)
+        self._my_clade      = Symbiont._clades[clade_number]
+        self._clade_fast    = Symbiont._clade_fasts[clade_number]  # per-clade constants
         self._cell          = cell
         self._how_arrived   = SymbiontState.ARRIVED_FROM_POOL
         self._parent_id     = -1        # arriving from pool, no parent
@@ -225,8 +291,8 @@ class Symbiont:
         # INDIVIDUAL SYMBIONT FUZZING
         # Rather than fuzzing uniformly, use normal with 95% of the data
         # between (mu +/- mu*f) -- see implementation in rng.py
-        m = float(self._my_clade.getMCR())
-        f = float(self._my_clade.getMCRFuzz())  # assume to be % of the mean
+        m = self._clade_fast[0]  # mitotic cost rate (as float)
+        f = self._clade_fast[1]  # assume to be % of the mean
         self._mitotic_cost_rate = RNG.fuzz(m, f, Stream.MITOTIC_COST_RATE)
 
         self._production_rate = self._computeProductionRate(is_copy = False, current_time = current_time)
@@ -235,13 +301,16 @@ class Symbiont:
         # Connor and Barry experimented and determined gamma(2,0.75) looks
         # reasonable -- mean = 1.5, 50% = 1.25
         # 08 Oct 2016: add max, per Malcolm suggetion in 7 Oct meeting
-        clade_max_photosynthate = self._my_clade.getMaxInitialSurplus()
-        self._photosynthate_surplus = INFINITY
-        while self._photosynthate_surplus > clade_max_photosynthate:
-            self._photosynthate_surplus = RNG.gamma( \
-                self._my_clade.getInitialSurplusShape(), \
-                self._my_clade.getInitialSurplusScale(), \
-                Stream.PHOTOSYNTHATE)
+        # (the max truncates the gamma by rejection, which keeps the stream of
+        # draws reproducible; w/ gamma(2,0.75) and max 4 about 3% of draws are
+        # rejected, so the clade values are looked up once, outside the loop)
+        clade_max_photosynthate = self._clade_fast[6]
+        shape = self._clade_fast[7]
+        scale = self._clade_fast[8]
+        surplus = RNG.gamma(shape, scale, Stream.PHOTOSYNTHATE)
+        while surplus > clade_max_photosynthate:
+            surplus = RNG.gamma(shape, scale, Stream.PHOTOSYNTHATE)
+        self._photosynthate_surplus = surplus
         #print(">>>>>>>>> ORIG SURPLUS= ",self._photosynthate_surplus)
 
         self._surplus_on_arrival = self._photosynthate_surplus
@@ -255,16 +324,20 @@ class Symbiont:
         # 5 Oct 2016: also want a list of all cells visited so we can dump that
         # info into CSV at end, but more importantly the hcd for those cells
         # (looking for evolutionary advantages given symbionts)...
-        self._cells_inhabited         = [str(cell.getRowCol()).replace(', ',',')]
-        self._inhabit_times           = [current_time]
-        self._hcds_of_cells_inhabited = [cell.getDemand()]
-
+        #
         # 5 Oct 2016: Malcolm also wanted to keep track of the g0 and g1sg2m
         # lengths for symbiont's, to look for evolutionary advantage; these
         # times are created at random with each g0 and g1sg2m event, so we need
         # to also store all of them in a list per symbiont
-        self._g0_times = []
-        self._g1sg2m_times = []
+        # (all of these lists are only kept when writing the CSV information)
+        if Symbiont._write_csv:
+            self._trail                   = [(*cell.getRowCol(), current_time, cell.getDemand())]
+            self._g0_times                = array('d')
+            self._g1sg2m_times            = array('d')
+        else:
+            self._trail                   = Symbiont._NO_CSV
+            self._g0_times                = Symbiont._NO_CSV
+            self._g1sg2m_times            = Symbiont._NO_CSV
 
         # 13 Feb 2017: also track the # of open cells around at time of division
         #self._cells_at_division = []
@@ -284,6 +357,17 @@ class Symbiont:
         self._scheduleInitialEvents(current_time)
         self._setNextEvent()
 
+    #############################################################################
+    @staticmethod
+    def _blank() -> 'Symbiont':
+        ''' allocates a Symbiont object (possibly a released one -- see
+            __new__) without calling the initializer, for use by the copy
+            constructor below, which assigns every slot itself
+        Returns:
+            an uninitialized Symbiont object
+        '''
+        return Symbiont.__new__(Symbiont)
+
     #############################################################################
     def _SymbiontCopy(self, cell: Cell or None, current_time: float) -> 'Symbiont':
         ''' This "copy constructor" is used to create symbionts that occur from
@@ -299,7 +383,26 @@ class Symbiont:
         Returns:
             a newly copied and modified Symbiont object resulting from mitosis
         '''
-        new_symbiont = copy.copy(self)  # make an exact copy of this symbiont
+        # make a copy of this symbiont by assigning the inherited slots directly
+        # into a blank Symbiont (much cheaper than copy.copy on a __slots__
+        # object); the remaining slots are all assigned anew below
+        new_symbiont = Symbiont._blank()
+        new_symbiont._clade_number            = self._clade_number
+        new_symbiont._my_clade                = self._my_clade
+        new_symbiont._clade_fast              = self._clade_fast
+        new_symbiont._mitotic_cost_rate       = self._mitotic_cost_rate
+        new_symbiont._production_rate         = self._production_rate
+        new_symbiont._photosynthate_surplus   = self._photosynthate_surplus
+        new_symbiont._surplus_on_arrival      = self._surplus_on_arrival
+        # event times are inherited too: a child w/o a cell never schedules
+        # its own, and its exit output reports these
+        new_symbiont._time_of_escape          = self._time_of_escape
+        new_symbiont._time_of_digestion       = self._time_of_digestion
+        new_symbiont._time_of_denouement      = self._time_of_denouement
+        new_symbiont._time_of_next_end_g0     = self._time_of_next_end_g0
+        new_symbiont._time_of_next_end_g1sg2m = self._time_of_next_end_g1sg2m
+        new_symbiont._next_event_time         = self._next_event_time
+        new_symbiont._next_event_type         = self._next_event_type
 
         # now begin updating its values as a symbiont arriving anew from mitosis
         new_symbiont._id = Symbiont._count
@@ -318,11 +421,15 @@ class Symbiont:
 
         # 23 Sep 2016 and 5 Oct 2016 and 13 Feb 2017:
         # clear out any switched times inherited from parent
-        new_symbiont._cells_inhabited         = []  # may be updated below...
-        new_symbiont._inhabit_times           = []
-        new_symbiont._hcds_of_cells_inhabited = []
-        new_symbiont._g0_times                = []
-        new_symbiont._g1sg2m_times            = []
+        # (lists only kept when writing the CSV information -- see __init__)
+        if Symbiont._write_csv:
+            new_symbiont._trail                   = []  # may be updated below...
+            new_symbiont._g0_times                = array('d')
+            new_symbiont._g1sg2m_times            = array('d')
+        else:
+            new_symbiont._trail                   = Symbiont._NO_CSV
+            new_symbiont._g0_times                = Symbiont._NO_CSV
+            new_symbiont._g1sg2m_times            = Symbiont._NO_CSV
         #new_symbiont._cells_at_division       = []
 
         ## 12 Apr 2016
@@ -340,16 +447,15 @@ class Symbiont:
         new_symbiont._mitotic_cost_rate = RNG.fuzz(m, f, Stream.MITOTIC_COST_RATE)
         '''
         ## NEW WAY -- using combined gamma for deleterious & beneificial
-        [fuzzamt, mutation] = RNG.divfuzz(m, self._my_clade, Stream.MITOTIC_COST_RATE_MUTATION)
-        if mutation == MutationType.DELETERIOUS:
-            new_symbiont._mitotic_cost_rate += fuzzamt  # deleterious mcr increases
-        else:  # mutation == MutationType.BENEFICIAL:
-            new_symbiont._mitotic_cost_rate -= fuzzamt  # beneficial mcr decreases
+        # (sign is +1 deleterious, -1 beneficial, 0 no mutation: deleterious
+        #  mcr increases, beneficial mcr decreases)
+        [fuzzamt, sign] = RNG.divfuzz(m, self._my_clade, Stream.MITOTIC_COST_RATE_MUTATION)
+        new_symbiont._mitotic_cost_rate = m + sign * fuzzamt
 
         # uncomment below if want to see info about mutations...
         '''
-        if mutation != MutationType.NO_MUTATION:
-            mut_type = 'DEL' if mutation == MutationType.DELETERIOUS else 'BEN'
+        if sign != 0:
+            mut_type = 'DEL' if sign > 0 else 'BEN'
             print(f'@ t={current_time} {new_symbiont._id} {mut_type} mcr: {m} {new_symbiont._mitotic_cost_rate}')
         '''
 
@@ -365,17 +471,15 @@ class Symbiont:
         fuzzedhalf = RNG.divfuzz(half, Stream.PHOTOSYNTHATE)
         '''
         ## NEW WAY -- using combined exponential for deleterious & beneficial
-        [fuzzamt, mutation] = RNG.divfuzz(half, self._my_clade, Stream.PHOTOSYNTHATE_MUTATION)
-        fuzzedhalf = half
-        if mutation == MutationType.DELETERIOUS:
-            fuzzedhalf -= fuzzamt  # deleterious inheritance slightly less than half
-        elif mutation == MutationType.BENEFICIAL:
-            fuzzedhalf += fuzzamt  # beneficial inheritance slightly more than half
+        # (deleterious inheritance slightly less than half, beneficial
+        #  inheritance slightly more than half)
+        [fuzzamt, sign] = RNG.divfuzz(half, self._my_clade, Stream.PHOTOSYNTHATE_MUTATION)
+        fuzzedhalf = half - sign * fuzzamt
 
         # uncomment below if want to see info about mutations...
         '''
-        if mutation != MutationType.NO_MUTATION:
-            mut_type = 'DEL' if mutation == MutationType.DELETERIOUS else 'BEN'
+        if sign != 0:
+            mut_type = 'DEL' if sign > 0 else 'BEN'
             print(f'@ t={current_time} {new_symbiont._id} {mut_type} surplus: {half} {fuzzedhalf}')
         '''
 
@@ -403,12 +507,33 @@ class Symbiont:
             new_symbiont._setNextEvent()
 
             # 5 Oct 2016
-            new_symbiont._cells_inhabited         = [str(new_symbiont._cell.getRowCol()).replace(', ',',')]
-            new_symbiont._inhabit_times           = [current_time]
-            new_symbiont._hcds_of_cells_inhabited = [new_symbiont._cell.getDemand()]
+            if Symbiont._write_csv:
+                new_cell = new_symbiont._cell
+                new_symbiont._trail = [(*new_cell.getRowCol(), current_time, new_cell.getDemand())]
 
         return new_symbiont # return the newly created copy
 
+    ##############################################################################################
+    def _computeSurplusOnly(self, this_time: float, next_time: float, state: SymbiontState) -> float:
+        ''' This method computes the amount of photosynthate surplus present at
+            the end of an event that the symbiont is already known to reach
+            (i.e., with no digestion or exit to schedule) -- the same surplus
+            as _computeSurplusAtEventEnd, w/o its digestion/exit check
+        Parameters:
+            this_time: this symbiont's previous event time (float)
+            next_time: this symbiont's current event time (float)
+            state: the state of the symbiont over that period (e.g., IN_G0)
+        Returns:
+            the computed surplus at the end of the event (float)
+        '''
+        # (same evaluation order as in _computeSurplusAtEventEnd)
+        time_diff = next_time - this_time
+        if state is _IN_G1SG2M:
+            return self._photosynthate_surplus + time_diff * self._production_rate \
+                   - time_diff * self._cell.getDemand() - time_diff * self._mitotic_cost_rate
+        return self._photosynthate_surplus + time_diff * self._production_rate \
+               - time_diff * self._cell.getDemand()
+
     ##############################################################################################
     def _computeSurplusAtEventEnd(self, this_time: float, next_time: float, state: SymbiontState) \
                 -> list[float, float or None, float or None]:
@@ -430,24 +555,27 @@ class Symbiont:
         # if this symbiont can't produce photosynthate at a rate sufficient
         # to meet the host cell's demand through the next event, will need
         # to eventually (elsewhere) schedule the exit strategy...
+        # (instance values bound to locals once, as this runs on every event;
+        # the surplus expression keeps the original evaluation order, i.e.,
+        # surplus + produced - demanded - expended, so results are unchanged)
         time_diff = next_time - this_time
-        produced = time_diff * self._production_rate
-        demanded = time_diff * self._cell.getDemand()
-        expended = 0
+        surplus   = self._photosynthate_surplus
+        rate      = self._production_rate
+        demand    = self._cell.getDemand()
 
         # only during mitosis (coming out of G1SG2M) should we compute and
         # expended photosynthate as a cost for undergoing mitosis (state will
         # be IN_G1SG2M)
-        if state == SymbiontState.IN_G1SG2M:
-            expended = time_diff * self._mitotic_cost_rate
-
-        surplus_at_end = self._photosynthate_surplus + produced - demanded - expended
+        if state is _IN_G1SG2M:
+            surplus_at_end = surplus + time_diff * rate - time_diff * demand \
+                                     - time_diff * self._mitotic_cost_rate
+        else:
+            surplus_at_end = surplus + time_diff * rate - time_diff * demand
 
         '''
         logging.debug(f'\t>>>time of next event: {next_time}')
-        logging.debug(f'\t>>>produced:           {produced}')
-        logging.debug(f'\t>>>demanded:           {demanded}')
-        logging.debug(f'\t>>>expended:           {expended}')
+        logging.debug(f'\t>>>produced:           {time_diff * rate}')
+        logging.debug(f'\t>>>demanded:           {time_diff * demand}')
         logging.debug(f'\t>>>surplus then:       {surplus_at_end}')
         '''
 
@@ -465,12 +593,14 @@ class Symbiont:
             # and the computed time of digestion t_d can be computed by solving
             # y - y1 = m(x - x1) using (t_c,s_c) and solving for x when y = 0:
             #         t_d = t_c - (s_c/m)
+            # (t_e - t_c is time_diff, already computed above; the slope and
+            # root are kept as two steps, as folding them into a single
+            # t_c - s_c*(t_e - t_c)/(s_e - s_c) would round differently)
             t_c = this_time
-            s_c = self._photosynthate_surplus
-            t_e = next_time
+            s_c = surplus
             s_e = surplus_at_end
-            assert((t_e - t_c) > 0.0)
-            m   = (s_e - s_c) / float(t_e - t_c)
+            assert(time_diff > 0.0)
+            m   = (s_e - s_c) / time_diff
             t_d = t_c - (s_c / m)  # computed time of digestion
             #logging.debug(f'\t>>>time of digestion:  {t_d}')
 
@@ -479,13 +609,13 @@ class Symbiont:
             stream_prob = None
             prob        = None
             stream_exit = None
-            if state == SymbiontState.IN_G0:
+            if state is _IN_G0:
                 stream_prob = Stream.DIGESTION_VS_ESCAPE_G0
-                prob        = self._my_clade.getG0EscapeProb()
+                prob        = self._clade_fast[9]   # G0 escape prob
                 stream_exit = Stream.TIME_G0_ESCAPE
-            elif state == SymbiontState.IN_G1SG2M:
+            elif state is _IN_G1SG2M:
                 stream_prob = Stream.DIGESTION_VS_ESCAPE_G1SG2M
-                prob        = self._my_clade.getG1SG2MEscapeProb()
+                prob        = self._clade_fast[10]  # G1SG2M escape prob
                 stream_exit = Stream.TIME_G1SG2M_ESCAPE
             else:
                 assert(False) # should never get here if state is not one of the above
@@ -501,42 +631,29 @@ class Symbiont:
         return [surplus_at_end, t_d, t_ee]
 
     #############################################################################
-    def _computeNextEndOfG0(self, current_time: float) -> float:
-        ''' Method to compute the next time of an end-of-G0 event, using
-                current_time + avg G0 length +/- small fudge
+    def _computeNextEnd(self, current_time: float, state: SymbiontState) -> float:
+        ''' Method to compute the next time of an end-of-G0 or end-of-G1SG2M
+            event, using
+                current_time + avg G0 (or G1SG2M) length +/- small fudge
+            and recording the fuzzed length for this symbiont
         Parameters:
             current_time: the current event (simulation) time (float)
+            state: SymbiontState.IN_G0 for the next end-of-G0 time, or
+                SymbiontState.IN_G1SG2M for the next end-of-G1SG2M time
         Returns:
-            the next end-of-G0 time for this symbiont (float)
+            the next end-of-G0 (or end-of-G1SG2M) time for this symbiont (float)
         '''
         # using normal distribution
-        m = self._my_clade.getG0Length()
-        f = self._my_clade.getG0Fuzz()
-        g0_time = RNG.fuzz(m, f, Stream.END_G0)  # fuzzed version of G0 length
-        #print(f">>> G0: {g0_time}")
-
-        next_time = current_time + g0_time
-        self._g0_times.append(g0_time)
-        return next_time
-
-    #############################################################################
-    def _computeNextEndOfG1SG2M(self, current_time: float) -> float:
-        ''' Method to compute the next time of an end-of-G1SG2m event, using
-                current_time + avg G1SG2M length +/- small fudge
-        Parameters:
-            current_time: the current event (simulation) time (float)
-        Returns:
-            the next end-of-G1SG2M time for this symbiont (float)
-        '''
-        # Using normal distribution
-        m = self._my_clade.getG1SG2MLength()
-        f = self._my_clade.getG1SG2MFuzz()
-        g1sg2m_time = RNG.fuzz(m, f, Stream.END_G1SG2M)  # fuzzed version of G1SG2M length
-        #print(f">>> G1SG2M: {g1sg2m_time}")
+        params = self._clade_fast
+        if state is _IN_G0:
+            m, f, stream, times = params[2], params[3], Stream.END_G0, self._g0_times
+        else:
+            m, f, stream, times = params[4], params[5], Stream.END_G1SG2M, self._g1sg2m_times
+        length = RNG.fuzz(m, f, stream)  # fuzzed version of G0 (or G1SG2M) length
+        #print(f">>> {state.name}: {length}")
 
-        next_time = current_time + g1sg2m_time
-        self._g1sg2m_times.append(g1sg2m_time)
-        return next_time
+        if Symbiont._write_csv: times.append(length)
+        return current_time + length
 
     #############################################################################
     def endOfG0(self, current_time: float) -> None:
@@ -553,25 +670,22 @@ class Symbiont:
         '''
 
         self._time_of_next_end_g0 = INFINITY
-        assert(self._prev_event_type == EventType.ARRIVAL or \
-               self._prev_event_type == EventType.END_G1SG2M)
+        assert(self._prev_event_type is EventType.ARRIVAL or \
+               self._prev_event_type is EventType.END_G1SG2M)
 
         # first, compute the photosynthate surplus since last event (the last
         # event will have been an end-of-G1/S/G2/M); 
         # computed surplus should never be negative here
-        # (_computeSurplusAtEventEnd uses state when determining digestion or exit)
-        [surplus_at_end, time_of_digestion, time_of_exit] = \
-            self._computeSurplusAtEventEnd(self._prev_event_time, current_time, \
-                                          state = SymbiontState.IN_G0)
-
-        assert(time_of_digestion == None) # sanity check -- should not have a value
-        assert(time_of_exit == None)      # sanity check -- should not have a value
+        # (so there is no digestion or exit to check for -- see _computeSurplusOnly)
+        surplus_at_end = self._computeSurplusOnly(self._prev_event_time, current_time, \
+                                                  state = SymbiontState.IN_G0)
+        assert(surplus_at_end >= 0) # sanity check -- no digestion or exit
 
         self._photosynthate_surplus = surplus_at_end
 
         # now, compute the amount of photosynthate produced, demanded by the
         # host cell, and expended on mitosis during the entire G1/S/G2/M period
-        time_of_end_g1sg2m = self._computeNextEndOfG1SG2M(current_time)
+        time_of_end_g1sg2m = self._computeNextEnd(current_time, SymbiontState.IN_G1SG2M)
         [surplus_at_end, time_of_digestion, time_of_exit] = \
             self._computeSurplusAtEventEnd(current_time, time_of_end_g1sg2m, \
                                           SymbiontState.IN_G1SG2M)
@@ -597,7 +711,7 @@ class Symbiont:
         self._setNextEvent()
 
     #############################################################################
-    def endOfG1SG2M(self, current_time: float) -> list[SymbiontState, 'Symbiont']:
+    def endOfG1SG2M(self, current_time: float) -> tuple[SymbiontState, 'Symbiont']:
         ''' Method to handle the transition from end of G1SG2M, when the mitosis
             is completing, into the next G0 state.  This method checks for all
             possible scenarios of what can happen when division is successful:
@@ -615,7 +729,7 @@ class Symbiont:
         Parameters:
             current_time: the current simulation time -- @ end of G1SG2M (float)
         Returns:
-            a list containing the status resulting from the mitosis, and the
+            a tuple containing the status resulting from the mitosis, and the
             resulting child symbiont; possible statuses returned:
                 SymbiontState.PARENT_INFECTS_OUTSIDE
                 SymbiontState.CHILD_INFECTS_OUTSIDE
@@ -628,25 +742,23 @@ class Symbiont:
 
         self._time_of_next_end_g1sg2m = INFINITY
         return_status_and_child = None
+        parent_stays = True  # set False in the branches where the parent leaves
     
-        assert(self._prev_event_type == EventType.END_G0)
+        assert(self._prev_event_type is EventType.END_G0)
     
         # remember that, to save computation, we could have already computed the 
         # photosynthate surplus to this point (see comment above), but it makes
         # debugging easier if this is here;
         # computed surplus should never be negative here
-        # (_computeSurplusAtEventEnd uses state when determining digestion or exit);
+        # (so there is no digestion or exit to check for -- see _computeSurplusOnly);
         #
         # also note that in endOfG0(), we precomputed what the additional cost of
         # division would entail, and if more than symbiont can afford, would never
         # have gotten here, but would have escaped or been digested earlier
         #
-        [surplus_at_end, time_of_digestion, time_of_exit] = \
-            self._computeSurplusAtEventEnd(self._prev_event_time, current_time, \
-                                          state = SymbiontState.IN_G1SG2M)
-    
-        assert(time_of_digestion == None) # should not get here otherwise...
-        assert(time_of_exit == None)      # should not get here otherwise...
+        surplus_at_end = self._computeSurplusOnly(self._prev_event_time, current_time, \
+                                                  state = SymbiontState.IN_G1SG2M)
+        assert(surplus_at_end >= 0) # should not get here otherwise...
     
         self._photosynthate_surplus = surplus_at_end
         self._num_divisions = self._num_divisions + 1
@@ -655,6 +767,12 @@ class Symbiont:
         # a (modeled) cell outside our environment if the original symbiont is
         # in the top or bottom row of the host cell grid)
         open_cell = self._checkForOpenAdjacentCell()
+
+        # bind the parent's (current) cell and clade constants once for the
+        # branches below; self._cell itself is reassigned only in the branches
+        # where the parent moves or leaves
+        cell       = self._cell
+        clade_fast = self._clade_fast
     
         # self._cell is the parent's cell
         # inside _SymbiontCopy, self refers to parent and new_symbiont to child
@@ -676,7 +794,7 @@ class Symbiont:
         #             or if parent is not moving to cell outside our grid
     
         #########################################################################
-        if open_cell == SymbiontState.CELL_OUTSIDE_ENVIRONMENT:
+        if open_cell is SymbiontState.CELL_OUTSIDE_ENVIRONMENT:
         #########################################################################
             # this is not an eviction -- we are presuming the new symbiont is
             # infecting a cell outside the scope of our modeled environment
@@ -684,15 +802,16 @@ class Symbiont:
             # child is created but it or parent presumed gone outside our
             # environment -- call the _SymbiontCopy method
             prob = RNG.uniform(0, 1, Stream.EVICTION)
-            if prob < self._my_clade.getParentEvictionProb():
+            if prob < clade_fast[11]:  # parent eviction prob
                 ######################################################
                 ## child stays in current cell, parent infects outside
                 ######################################################
                 #print(f"Parent infecting cell along border {self._id}")
-                child = self._SymbiontCopy(self._cell, current_time)
-                self._cell.setSymbiont(child, current_time) # update cell to contain child
+                child = self._SymbiontCopy(cell, current_time)
+                cell.setSymbiont(child, current_time) # update cell to contain child
                 self._cell = None  # parent infects outside (i.e., no cell in model)
-                return_status_and_child = [SymbiontState.PARENT_INFECTS_OUTSIDE, child]
+                return_status_and_child = (SymbiontState.PARENT_INFECTS_OUTSIDE, child)
+                parent_stays = False
                 # info on current cell inhabited by child occurs in _SymbiontCopy
             else:
                 ######################################################
@@ -701,51 +820,53 @@ class Symbiont:
                 #print(f"Child infecting cell along border {self._id}")
                 no_cell = None
                 child = self._SymbiontCopy(no_cell, current_time) 
-                return_status_and_child = [SymbiontState.CHILD_INFECTS_OUTSIDE, child]
+                return_status_and_child = (SymbiontState.CHILD_INFECTS_OUTSIDE, child)
                 # no need to update new cells inhabited for either parent or child
             #
         #########################################################################
         elif open_cell is not None:  # there is an open cell for child or parent
         #########################################################################
             prob = RNG.uniform(0, 1, Stream.EVICTION)
-            if prob < self._my_clade.getParentEvictionProb():
+            if prob < clade_fast[11]:  # parent eviction prob
                 ## child stays in current cell, parent moves to the new open cell
                 #print(f"Parent goes to open cell {self._id}")
-                child = self._SymbiontCopy(self._cell, current_time)
-                self._cell.setSymbiont(child, current_time) # current cell now contains child
+                child = self._SymbiontCopy(cell, current_time)
+                cell.setSymbiont(child, current_time) # current cell now contains child
     
                 # use affinity values to determine if symbiont is phagocytosed
-                phagocytosed = Symbiont._determinePhagocytosis(self._my_clade, is_arrival = False)
+                # (the division case of _determinePhagocytosis, inlined)
+                phagocytosed = RNG.uniform(0, 1, Stream.DIVISION_AFFINITY) < clade_fast[16]
                 if phagocytosed:
                     self._cell = open_cell
                     open_cell.setSymbiont(self, current_time)  # open cell now contains parent
                     # info on new cell inhabited by child occurs in _SymbiontCopy;
                     # but need to record info on parent switching to new open cell
-                    self._cells_inhabited.append(str(open_cell.getRowCol()).replace(', ',','))
-                    self._inhabit_times.append(current_time)
-                    self._hcds_of_cells_inhabited.append(open_cell.getDemand())
-                    return_status_and_child = [SymbiontState.BOTH_STAY, child]
+                    if Symbiont._write_csv:
+                        self._trail.append((*open_cell.getRowCol(), current_time, open_cell.getDemand()))
+                    return_status_and_child = (SymbiontState.BOTH_STAY, child)
                 else:
                     # similar to parent evicted
                     self._cell = None # parent now homeless
-                    return_status_and_child = [SymbiontState.PARENT_NO_AFFINITY, child]
+                    return_status_and_child = (SymbiontState.PARENT_NO_AFFINITY, child)
+                    parent_stays = False
             else:
                 ## parent stays in current cell, child moves to the new open cell
                 ## call symbiont copy constructor, place into open cell
                 #print(f"Child goes to open cell {child.id}")
             
                 # use affinity values to determine if symbiont is phagocytosed
-                phagocytosed = Symbiont._determinePhagocytosis(self._my_clade, is_arrival = False)
+                # (the division case of _determinePhagocytosis, inlined)
+                phagocytosed = RNG.uniform(0, 1, Stream.DIVISION_AFFINITY) < clade_fast[16]
                 if phagocytosed:
                     # info on new cell inhabited by child occurs in _SymbiontCopy
                     child = self._SymbiontCopy(open_cell, current_time)
                     open_cell.setSymbiont(child, current_time)
-                    return_status_and_child = [SymbiontState.BOTH_STAY, child]
+                    return_status_and_child = (SymbiontState.BOTH_STAY, child)
                     # no need to update new cells inhabited for either parent or child
                 else:
                     no_cell = None
                     child = self._SymbiontCopy(no_cell, current_time)
-                    return_status_and_child = [SymbiontState.CHILD_NO_AFFINITY, child]
+                    return_status_and_child = (SymbiontState.CHILD_NO_AFFINITY, child)
             # 
         #########################################################################
         else: # there is no open cell for a new symbiont
@@ -757,14 +878,15 @@ class Symbiont:
             # if 1, the parent will be evicted into the pool, and the copied 
             #     child will go into the current cell
             prob = RNG.uniform(0, 1, Stream.EVICTION) 
-            if prob < self._my_clade.getParentEvictionProb():
+            if prob < clade_fast[11]:  # parent eviction prob
                 ## child stays in current cell, parent evicted into pool;
                 ## call symbiont copy constructor, place child into current cell
                 #print(f"Parent evicted into pool {self._id}")
-                child = self._SymbiontCopy(self._cell, current_time)
-                self._cell.setSymbiont(child, current_time)
+                child = self._SymbiontCopy(cell, current_time)
+                cell.setSymbiont(child, current_time)
                 self._cell = None  # parent now homeless
-                return_status_and_child = [SymbiontState.PARENT_EVICTED, child]
+                return_status_and_child = (SymbiontState.PARENT_EVICTED, child)
+                parent_stays = False
                 # info on new cell inhabited by child occurs in _SymbiontCopy
             else:
                 ## parent stays in current cell, child evicted into pool;
@@ -772,19 +894,17 @@ class Symbiont:
                 #print(f"Child evicted into pool {child.id}")
                 no_cell = None
                 child = self._SymbiontCopy(no_cell, current_time)
-                return_status_and_child = [SymbiontState.CHILD_EVICTED, child]
+                return_status_and_child = (SymbiontState.CHILD_EVICTED, child)
                 # no need to update new cells inhabited for either parent or child
         #########################################################################
     
-        # only in the parent-evicted or parent-infects-outside cases above 
-        # do we NOT try to update the parent's next end of G0
-        if not (return_status_and_child[0] == SymbiontState.PARENT_EVICTED or \
-                return_status_and_child[0] == SymbiontState.PARENT_INFECTS_OUTSIDE or \
-                return_status_and_child[0] == SymbiontState.PARENT_NO_AFFINITY):  
+        # only in the parent-evicted, parent-infects-outside, or parent-no-
+        # affinity cases above do we NOT try to update the parent's next end of G0
+        if parent_stays:
             # must make sure that parent can make it through this next G0 event
             # (e.g., could be producing at rate less than host cell demand, but
             # banked photosynthate is sufficient to allow it through a few events)
-            time_of_end_of_g0 = self._computeNextEndOfG0(current_time)
+            time_of_end_of_g0 = self._computeNextEnd(current_time, SymbiontState.IN_G0)
             # note the parent's photosynthate has already been divided in _SymbiontCopy
             [surplus_at_end, time_of_digestion, time_of_exit] = \
                 self._computeSurplusAtEventEnd(current_time, time_of_end_of_g0, \
@@ -815,39 +935,29 @@ class Symbiont:
             bottom row)
         '''
 
-        # check the Moore neighborhood at random
-        row, col  = self._cell.getRowCol()
-        positions = [(-1,-1),(-1,0),(-1,1), \
-                     ( 0,-1),       ( 0,1), \
-                     ( 1,-1),( 1,0),( 1,1)]
-    
-        num_open_inside_environment = 0 # will be used for border cases
-    
+        # check the Moore neighborhood at random, using the cell's precomputed
+        # tuple of neighbors (None for positions above the top row or below the
+        # bottom row -- the sponge canal wraps horizontally but not vertically
+        # since we are modeling only a slice of the canal); the shuffle is of
+        # the (eight) neighbor positions, checked from the end of the shuffle
+        row       = self._cell.getRowCol()[0]
+        neighbors = self._cell.getNeighbors()
+        positions = [0, 1, 2, 3, 4, 5, 6, 7]  # indices into neighbors
+
         RNG.shuffle(positions, Stream.CHECK_FOR_OPEN_CELL)
-    
+
         open_cell = None
-        found     = False
-        while (not found) and len(positions) > 0:
-            pos = positions.pop()  # grab the first position from the random shuffle
-    
-            # remember that the sponge canal wraps horizontally (cols) but not 
-            # vertically (rows) since we are modeling only a slice of the canal
-            row_offset = pos[0]
-            if row + row_offset < 0 or row + row_offset >= Parameters.NUM_ROWS:
-                continue
-    
-            col_offset = pos[1]
-            candidate_cell = Symbiont.sponge.getCell( row + row_offset, \
-                (col + col_offset) % Parameters.NUM_COLS )  # wrap the column
-            if not candidate_cell.isOccupied():
+        for pos in reversed(positions):
+            candidate_cell = neighbors[pos]
+            if candidate_cell is not None and not candidate_cell.isOccupied():
                 open_cell = candidate_cell
-                found = True
+                break
     
         # if there is an open cell and the parent lives on the top or bottom
         # row, the occupied cell will be in the Moore neighborhood within our
         # 2D grid with probability 5/8 (e.g., on top row, cells W,E,SW,S,SE are 
         # inside our modeled grid but cells NW,N,NE are outside our grid)
-        if open_cell is not None and (row == 0 or row == Parameters.NUM_ROWS - 1):
+        if open_cell is not None and (row == 0 or row == Symbiont._last_row):
             p = RNG.uniform(0, 1, Stream.INFECT_CELL_OUTSIDE)
             # with prob 3/8, infect outside; with prob 5/8, infect inside
             if p < 0.375:  # probability 3/8 infects outside
@@ -893,11 +1003,8 @@ class Symbiont:
         # 8 Oct 2016: keep track of photosynthate at end, even if leaving...
         # useful for the detailed csv per-symbiont tracking
         # (see comment in endOfG0 on use of computeSurplus method...)
-        [surplus_at_end, time_of_digestion, time_of_exit] = \
-            self._computeSurplusAtEventEnd(self._prev_event_time, current_time, \
-                                          state = None)
-        assert(time_of_digestion == None)  # sanity check
-        assert(time_of_exit == None)       # sanity check
+        surplus_at_end = self._computeSurplusOnly(self._prev_event_time, current_time, \
+                                                  state = None)
         assert(surplus_at_end >= 0)  # o/w, shouldn't have made it to denouement
 
         self._photosynthate_surplus = surplus_at_end
@@ -905,11 +1012,11 @@ class Symbiont:
 
     #############################################################################
     @staticmethod
-    def _determinePhagocytosis(clade: Clade, is_arrival: bool) -> bool:
+    def _determinePhagocytosis(clade_fast: tuple, is_arrival: bool) -> bool:
         ''' static method to determine whether phagocytosis happens based
             on clade-specific probability
         Parameters:
-            clade: Clade object corresponding to a symbiont clade
+            clade_fast: Clade.fast() tuple of the symbiont's clade
             is_arrival: True if symbiont is arriving, False o/w
         Returns:
             True if the symbiont will be phagocytosed (whether on arrival
@@ -928,11 +1035,11 @@ class Symbiont:
         if is_arrival:
             affinity_prob = RNG.uniform(0, 1, Stream.ARRIVAL_AFFINITY)  # flip a coin
             # retrieve arrival affinity probability based on clade
-            clade_prob = clade.getArrivalAffinityProb()
+            clade_prob = clade_fast[15]
         else:
             affinity_prob = RNG.uniform(0, 1, Stream.DIVISION_AFFINITY) # flip a coin
             # retrieve division affinity probability based on clade
-            clade_prob = clade.getDivisionAffinityProb()
+            clade_prob = clade_fast[16]
 
         # if u < p, return True (phagocytosed), o/w False (not phagocytosed)
         return affinity_prob < clade_prob
@@ -960,25 +1067,25 @@ class Symbiont:
         '''
         # NOTE: the order of occurrence is important here -- an event higher
         # in the order takes precedence of an event lower in the order should
-        # there be identical event times
-        self._next_event_time = self._time_of_next_end_g0
-        self._next_event_type = EventType.END_G0
+        # there be identical event times (hence the strict < comparisons);
+        # the running minimum is kept in locals and stored once at the end
+        next_time = self._time_of_next_end_g0
+        next_type = _END_G0
+
+        t = self._time_of_next_end_g1sg2m
+        if t < next_time: next_time = t; next_type = _END_G1SG2M
 
-        if self._time_of_next_end_g1sg2m < self._next_event_time:
-            self._next_event_time = self._time_of_next_end_g1sg2m
-            self._next_event_type = EventType.END_G1SG2M
+        t = self._time_of_escape
+        if t < next_time: next_time = t; next_type = _ESCAPE
 
-        if self._time_of_escape < self._next_event_time:
-            self._next_event_time = self._time_of_escape
-            self._next_event_type = EventType.ESCAPE
+        t = self._time_of_digestion
+        if t < next_time: next_time = t; next_type = _DIGESTION
 
-        if self._time_of_digestion < self._next_event_time:
-            self._next_event_time = self._time_of_digestion
-            self._next_event_type = EventType.DIGESTION
+        t = self._time_of_denouement
+        if t < next_time: next_time = t; next_type = _DENOUEMENT
 
-        if self._time_of_denouement < self._next_event_time:
-            self._next_event_time = self._time_of_denouement
-            self._next_event_type = EventType.DENOUEMENT
+        self._next_event_time = next_time
+        self._next_event_type = next_type
 
     #############################################################################
     def _scheduleInitialEvents(self, current_time: float) -> None:
@@ -1011,7 +1118,7 @@ class Symbiont:
         # words low reproducers will spend more time in G0 banking photosynthate
         # before entering the "going to divide" state of G1,S,G2,M from which there
         # is no turning back once committed
-        self._time_of_next_end_g0 = self._computeNextEndOfG0(current_time)
+        self._time_of_next_end_g0 = self._computeNextEnd(current_time, SymbiontState.IN_G0)
 
         # if this symbiont can't produce photosynthate at a rate sufficient
         # to meet the host cell's demand through G0, schedule the exit strategy...
@@ -1048,16 +1155,17 @@ class Symbiont:
         # equation of 
         #           y = rho_X + ((1-k)/k)*(x*rho_X/(N-1))
         # where y is the production rate and x is the corresponding row
-        k = self._my_clade.getPhotosyntheticReduction()
+        # ((1-k)/k and N-1 are constant, so are computed once -- see Clade.fast
+        # and bindClades -- keeping the same order of floating-point operations)
+        clade_fast = self._clade_fast
         #######################################################################
         if is_copy:
             rho = self._production_rate  # this is an exact copy of parent
         else:
-            rho = self._my_clade.getPPR()
+            rho = clade_fast[12]
         #######################################################################
-        num_rows, num_cols = Symbiont.sponge.getDimensions()
-        row, col = self._cell.getRowCol() # row x in the equation above
-        rate = rho + (float(1-k)/k) * (row*rho/float(num_rows-1))
+        row = self._cell.getRowCol()[0] # row x in the equation above
+        rate = rho + clade_fast[14] * (row*rho/Symbiont._row_divisor)
 
         ## 12 Apr 2016
         # for fuzzing, use normal with  95% of the data b/w (mu +/- mu*f) -- 
@@ -1066,22 +1174,19 @@ class Symbiont:
         # copy via division
         if is_copy:
             # use multi-distro division fuzzing -- see implementation in rng.py
-            [fuzz_amt, mutation] = RNG.divfuzz(rate, self._my_clade, Stream.PHOTOPROD_MUTATION)
-            fuzzed_rate = rate
-            if mutation == MutationType.DELETERIOUS:
-                fuzzed_rate -= fuzz_amt  # deleterious photoprod reduces
-            else: # mutation == MutationType.BENEFICIAL:
-                fuzzed_rate += fuzz_amt  # beneficial photoprod increases
+            # (deleterious photoprod reduces, beneficial photoprod increases)
+            [fuzz_amt, sign] = RNG.divfuzz(rate, self._my_clade, Stream.PHOTOPROD_MUTATION)
+            fuzzed_rate = rate - sign * fuzz_amt
             # uncomment below if want to see info about mutations...
             '''
-            if mutation != MutationType.NO_MUTATION:
-                mut_type = 'DEL' if mutation == MutationType.DELETERIOUS else 'BEN'
+            if sign != 0:
+                mut_type = 'DEL' if sign > 0 else 'BEN'
                 print(f'@ t={current_time} {self._id} {mut_type} ppr: {rate} {fuzzed_rate}")
             '''
         else:
             # use normal -- see implementation in rng.py
             m = rate
-            f = self._my_clade.getPPRFuzz()
+            f = clade_fast[13]
             fuzzed_rate = RNG.fuzz(m, f, Stream.PHOTOPROD)
 
         return fuzzed_rate  # y in the equation above
@@ -1133,72 +1238,74 @@ class Symbiont:
         # output for the statistics of that exiting symbiont.
         #
         if not Symbiont._write_csv: return
-        strval  = str(self._id)                + ','    # overall symbiont id number
-        strval += str(self._how_arrived.name)  + ','    # via pool or division
-        strval += str(self._parent_id)         + ','    # id of parent, -1 via pool
-        strval += str(self._agent_zero)        + ','    # id of ultimate ancestor
-        strval += str(self._clade_number)      + ','
-        strval += str(self._mitotic_cost_rate) + ','
-        strval += str(self._production_rate)   + ','
-        strval += str(self._arrival_time)      + ','    # arrival time
-        strval += str(current_time)            + ','    # exit time (1 of 4 above)
-        strval += str(exit_status.name)        + ','
-        ## begin added 31 Oct 2016
-        strval += str(self._prev_event_time)             + ','
-        strval += str(self._prev_event_type.name)        + ',' 
-        ## end added 31 Oct 2016
-        strval += str(current_time - self._arrival_time) + ','  # residence time
-        strval += str(self._surplus_on_arrival)          + ','  # surplus @ arrival
-        strval += str(self._photosynthate_surplus)       + ','  # surplus @ exit
-        strval += str(self._num_divisions)               + ','  # num successful divs
-        strval += str(self._time_of_escape)              + ','
-        strval += str(self._time_of_digestion)           + ','
-        strval += str(self._time_of_denouement)          + ','
-        if exit_status == SymbiontState.STILL_IN_RESIDENCE:
-            strval += SymbiontState.STILL_IN_RESIDENCE.name + ','
+        # the row is built by a single formatting of all fields into the
+        # precomputed row template (rather than by string concatenation)
+        trail = self._trail
+        # cells (perhaps multiple) inhabited by symbiont -- separate w/ ;
+        # (cells are kept as (row,col,time,hcd) tuples and only formatted here),
+        # along with the times inhabited and hcds of those cells; a child that
+        # never had a cell has none of these, so skip the joins entirely
+        if len(trail) == 0:
+            cells = inhabit_times = hcds = ''
+        elif len(trail) == 1:
+            row, col, time, hcd = trail[0]
+            cells = f'"({row},{col})"'
+            inhabit_times = str(time)
+            hcds = str(hcd)
         else:
-            strval += "NOT_IN_RESIDENCE,"
-        # append cells (perhaps multiple) inhabited by symbiont -- separate w/ ;
-        for i in range(len(self._cells_inhabited)):
-            strval += ('"' if i == 0 else ';') + str(self._cells_inhabited[i])
-        if len(self._cells_inhabited) > 0: strval += '"'
-        # append times (perhaps multiple) cells were inhabited by symbiont
-        strval += ','
-        for i in range(len(self._inhabit_times)):
-            strval += ('' if i == 0 else ';') + str(self._inhabit_times[i])
-        # append hcds (perhaps multiple) of cells inhabited by symbiont
-        strval += ','
-        for i in range(len(self._hcds_of_cells_inhabited)):
-            strval += ('' if i == 0 else ';') + str(self._hcds_of_cells_inhabited[i])
-        # append g0 times symbiont experienced; separate diff times by semicolon
-        strval += ','
+            cells = '"' + ';'.join(f'({row},{col})' for row, col, _, _ in trail) + '"'
+            inhabit_times = ';'.join(str(time) for _, _, time, _ in trail)
+            hcds = ';'.join(str(hcd) for _, _, _, hcd in trail)
+        #
         # if symbiont is a child immediately evicted or child who infected outside
         # that means it received a g0 time that was never used -- let's not
         # include the g0 time in the output; a parent who finished g1sg2m but was 
         # evicted or infected outside does not get assigned a new g0 time -- see 
         # endG1SG2M(); for a symbiont who is digested or escapes during G0 (added 
-        # via _computeNextEndOfG0() near end of endG1SG2M()), want to keep that g0
+        # via _computeNextEnd() near end of endG1SG2M()), want to keep that g0
         # time in the output as it was "partially" used...  (see overall comments
         # appended to the bottom of this program)
-        len_g0_times = len(self._g0_times)
-        if exit_status == SymbiontState.CHILD_INFECTS_OUTSIDE or \
-           exit_status == SymbiontState.CHILD_EVICTED: len_g0_times -= 1
-        for i in range(len_g0_times):
-            strval += ('' if i == 0 else ';') + str(self._g0_times[i])
-        #
-        # append g1sg2m times symbiont experienced; separate diff times by semicolon
-        strval += ','
-        for i in range(len(self._g1sg2m_times)):
-            strval += ('' if i == 0 else ';') + str(self._g1sg2m_times[i])
+        g0_times = self._g0_times
+        if exit_status is SymbiontState.CHILD_INFECTS_OUTSIDE or \
+           exit_status is SymbiontState.CHILD_EVICTED: g0_times = g0_times[:-1]
         #
-        # append cnt of open cells (at division) seen; separate diff times by semicolon
-        #strval += ','
-        #for i in range(len(self._cells_at_division)):
-        #    strval += ('' if i == 0 else ';') + str(self._cells_at_division[i])
-        #
-        strval += '\n'
-        Symbiont._csv_file.write(strval)
-        Symbiont._csv_writes += 1
+        strval = _CSV_ROW_FORMAT % ( \
+            self._id,                           # overall symbiont id number
+            self._how_arrived.name,             # via pool or division
+            self._parent_id,                    # id of parent, -1 via pool
+            self._agent_zero,                   # id of ultimate ancestor
+            self._clade_number,
+            self._mitotic_cost_rate,
+            self._production_rate,
+            self._arrival_time,                 # arrival time
+            current_time,                       # exit time (1 of 4 above)
+            exit_status.name,
+            ## begin added 31 Oct 2016
+            self._prev_event_time,
+            self._prev_event_type.name,
+            ## end added 31 Oct 2016
+            current_time - self._arrival_time,  # residence time
+            self._surplus_on_arrival,           # surplus @ arrival
+            self._photosynthate_surplus,        # surplus @ exit
+            self._num_divisions,                # num successful divs
+            self._time_of_escape,
+            self._time_of_digestion,
+            self._time_of_denouement,
+            SymbiontState.STILL_IN_RESIDENCE.name \
+                if exit_status is SymbiontState.STILL_IN_RESIDENCE else "NOT_IN_RESIDENCE",
+            cells,
+            inhabit_times,
+            hcds,
+            # g0 and g1sg2m times symbiont experienced; separate by semicolon
+            ';'.join(map(str, g0_times)) if len(g0_times) > 0 else '',
+            ';'.join(map(str, self._g1sg2m_times)) if len(self._g1sg2m_times) > 0 else '',
+            # cnt of open cells (at division) seen; separate by semicolon
+            #';'.join(map(str, self._cells_at_division)),
+            )
+        csv_buffer = Symbiont._csv_buffer
+        csv_buffer.append(strval)
+        if len(csv_buffer) >= Symbiont._csv_buffer_limit:
+            Symbiont._flushCSVBuffer()
 
     #############################################################################
     @classmethod
@@ -1208,14 +1315,35 @@ class Symbiont:
             probabilities of arriving -- used when generating a symbiont
             arrival
         '''
-        cls.clade_cumulative_proportions = numpy.cumsum(Parameters.CLADE_PROPORTIONS)
+        cls.clade_cumulative_proportions = \
+            numpy.cumsum(numpy.asarray(Parameters.CLADE_PROPORTIONS, dtype = numpy.float64))
         # set last entry to 1.0 just to be safe (avoid roundoff errors)
         cls.clade_cumulative_proportions[-1] = 1.0
+        # for only a few clades, a linear scan of a tuple of Python floats is
+        # faster than the (per-call) numpy overhead of searchsorted
+        if len(cls.clade_cumulative_proportions) <= cls._CLADE_SCAN_MAX:
+            cls._clade_cumulative_scan = tuple(cls.clade_cumulative_proportions.tolist())
+        else:
+            cls._clade_cumulative_scan = None
+
+    @classmethod
+    def bindClades(cls) -> None:
+        ''' class-level method to bind, once all clades have been parsed, the
+            Clade objects and their Clade.fast() tuples into class-level
+            tuples indexed by clade number, so that creating a symbiont need
+            not call into Clade for either; also binds the (constant) sponge
+            dimensions used on every division and arrival
+        '''
+        cls._clades      = tuple(Clade.getClade(i) for i in range(Parameters.NUM_CLADES))
+        cls._clade_fasts = tuple(Clade.fast(i) for i in range(Parameters.NUM_CLADES))
+        cls._row_divisor = float(Parameters.NUM_ROWS - 1)
+        cls._last_row    = Parameters.NUM_ROWS - 1
+        cls._num_cells   = Parameters.NUM_ROWS * Parameters.NUM_COLS
 
     @classmethod
     def openCSVFile(cls, csv_fname: str) -> None:
         cls._write_csv = True
-        cls._csv_file = open(csv_fname, "w")
+        cls._csv_file = open(csv_fname, "w", buffering = 1 << 20)
         cls._csv_file.write(\
            'symbID,poolOrDiv,parent,agentZero,clade,mcr,ppr,'\
           +'arrTime,exitTime,exitStatus,lastEventTime,lastEventType,'\
@@ -1231,15 +1359,21 @@ class Symbiont:
             current_time: current simulation time @ end (float)
         '''
         if not cls._write_csv: return
-        # write output for all those still in residence
-        rows, cols = cls.sponge.getDimensions()
-        for r in range(rows):
-            for c in range(cols):
-                cell = cls.sponge.getCell(r,c)
-                symbiont = cell.getSymbiont()
-                if symbiont is not None:
-                    symbiont.csvOutputOnExit(current_time, SymbiontState.STILL_IN_RESIDENCE)
+        # write output for all those still in residence (in row-major order
+        # of their cells, visiting only the occupied cells)
+        for cell in cls.sponge.getOccupiedCells():
+            cell.getSymbiont().csvOutputOnExit(current_time, SymbiontState.STILL_IN_RESIDENCE)
+        cls._flushCSVBuffer()
         Symbiont._csv_file.close()
+
+    @classmethod
+    def _flushCSVBuffer(cls) -> None:
+        ''' class-level method to write all buffered per-symbiont CSV rows to
+            the CSV file in a single write
+        '''
+        cls._csv_file.write(''.join(cls._csv_buffer))
+        cls._csv_writes += len(cls._csv_buffer)  # rows written, counted per flush
+        cls._csv_buffer.clear()
   
 
     #############################################################################
@@ -1250,20 +1384,16 @@ class Symbiont:
         Returns:
             the Cell object selected
         '''
-        # create a list of all open cells
-        open_cells = []
-        for r in range(Parameters.NUM_ROWS):
-            for c in range(Parameters.NUM_COLS):
-                cell = cls.sponge.getCell(r,c)
-                if not cell.isOccupied():
-                    open_cells.append(cell)
+        # find the (flat, row-major) indices of all open cells with one scan
+        # of the sponge's occupancy array
+        open_indices = cls.sponge.getOpenCellIndices()
 
         # we should never call this method unless there is at least one open cell
-        assert(len(open_cells) > 0)  # sanity check
+        assert(len(open_indices) > 0)  # sanity check
 
         # pick one @ random
-        which = RNG.randint(0, len(open_cells)-1, Stream.OPEN_CELL_ON_ARRIVAL)
-        return open_cells[which]
+        which = RNG.randint(0, len(open_indices)-1, Stream.OPEN_CELL_ON_ARRIVAL)
+        return cls.sponge.getCellByIndex(int(open_indices[which]))
 
     #######################################################################################
     @classmethod
@@ -1280,20 +1410,16 @@ class Symbiont:
         Returns:
             the Cell object selected
         '''
-        # create a list of all open cells
-        open_cells = []
-        for r in range(max_row - min_row):
-            for c in range(max_col - min_col):
-                cell = cls.sponge.getCell(min_row + r, min_col + c)
-                if not cell.isOccupied():
-                    open_cells.append(cell)
+        # find all open cells (in row-major order) with one scan of the
+        # sponge's occupancy array, rather than visiting each Cell object
+        rows, cols = cls.sponge.getOpenCellPositions(min_row, max_row, min_col, max_col)
 
         # we should never call this method unless there is at least one open cell
-        assert(len(open_cells) > 0)
+        assert(len(rows) > 0)
 
         # pick one @ random
-        which = RNG.randint(0, len(open_cells)-1, Stream.OPEN_CELL_ON_ARRIVAL)
-        return open_cells[which]
+        which = RNG.randint(0, len(rows)-1, Stream.OPEN_CELL_ON_ARRIVAL)
+        return cls.sponge.getCellUnchecked(int(rows[which]), int(cols[which]))
 
     ################################################################################
     @classmethod
@@ -1306,22 +1432,25 @@ class Symbiont:
             a new Symbiont object, if the sponge is not already full; None o/w
         '''
         # no need to even try if there are no available cells
-        if num_symbionts == Parameters.NUM_ROWS * Parameters.NUM_COLS:
+        if num_symbionts == cls._num_cells:
             #logging.debug('\tNo cells available')
             return None
 
         # now handle the arrival -- pick a clade at random using the previously
         # defined cumulative proportions for clades...
+        # (the first clade whose cumulative proportion exceeds prob)
         prob = RNG.uniform(0, 1, Stream.CLADE)
-        clade = 0
-        while prob >= cls.clade_cumulative_proportions[clade]: clade += 1
+        cumulative = cls._clade_cumulative_scan
+        if cumulative is not None:
+            clade = 0
+            while prob >= cumulative[clade]: clade += 1
+        else:
+            clade = int(numpy.searchsorted(cls.clade_cumulative_proportions, prob, side = 'right'))
     
         # now determine if there is appropriate affinity for infection;
-        # first grab the clade object and use it to calculate arrival affinity
-        this_clade = Clade.getClade(clade)
-
+        # using the clade's cached arrival affinity probability
         # if this symbiont has insufficient arrival affinity for host, can't get in
-        phagocytosed = cls._determinePhagocytosis(this_clade, is_arrival = True)
+        phagocytosed = cls._determinePhagocytosis(cls._clade_fasts[clade], is_arrival = True)
         if phagocytosed:
             # symbiont has arrival affinity - find an open cell for this symbiont
             open_cell = cls.findOpenCell()
@@ -1346,9 +1475,9 @@ class Symbiont:
 # parent infects outside
 #     - does not append new g0
 # digestion during G0:     last event type is END_G1SG2M
-#     - does append new g0 via _computeNextEndOfG0() near end of endG1SG2M()
+#     - does append new g0 via _computeNextEnd() near end of endG1SG2M()
 # escape during G0:        last event type is END_G1SG2M
-#     - does append new g0 via _computeNextEndOfG0() near end of endG1SG2M()
+#     - does append new g0 via _computeNextEnd() near end of endG1SG2M()
 # digestion during G1SG2M: last event type is END_G0
 #     - does not append a new g0 since doesn't get through G1SG2M
 # escape during G1SG2M:    last event type is END_G0